@@ -1,5 +1,4 @@
 from config.loader import Config
-import sys
 import os
 from pathlib import Path
 from jobs.config_utils import handle_config_errors
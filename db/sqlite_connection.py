@@ -2,22 +2,109 @@ import sqlite3
 import logging
 import sys
 import os
-import json
+import threading
 from contextlib import contextmanager
 from config.loader import Config
 from jobs.logging_setup import setup_logging
 
+# Per-thread connection installed by init_worker_connection for executor workers
+_thread_local = threading.local()
+
+# journal_mode=WAL is persistent in the database file, so it only needs checking once per file
+_wal_checked = set()
+_wal_lock = threading.Lock()
+
 def get_logger(application_name="executioner", run_id=None):
     return setup_logging(application_name, run_id or "main")
 
+def _enable_wal(conn, db_file):
+    with _wal_lock:
+        if db_file in _wal_checked:
+            return
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if mode.lower() != "wal":
+            conn.execute("PRAGMA journal_mode = WAL")
+        _wal_checked.add(db_file)
+
+def _connect(db_file, check_same_thread=True):
+    conn = sqlite3.connect(str(db_file), check_same_thread=check_same_thread)
+    # Set a default busy timeout to prevent immediate errors when database is locked
+    conn.execute("PRAGMA busy_timeout = 5000")  # 5 seconds
+    _enable_wal(conn, str(db_file))
+    # WAL + NORMAL only fsyncs at checkpoints and stays consistent across process crashes
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+    return conn
+
+def init_worker_connection(db_file=None, opened=None):
+    """ThreadPoolExecutor initializer: open one connection per worker thread, reused across jobs.
+
+    When opened is a list, the connection is appended to it so the pool's owner can
+    close it with close_worker_connections once the workers have exited.
+    """
+    db_file = str(db_file or Config.DB_FILE)
+    _thread_local.conn = _connect(db_file, check_same_thread=opened is None)
+    _thread_local.db_file = db_file
+    if opened is not None:
+        opened.append(_thread_local.conn)
+
+def _close_connection(conn, optimize):
+    if optimize:
+        try:
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass  # Statistics refresh is best-effort
+    conn.close()
+
+def close_thread_connection(optimize=False):
+    """Close the calling thread's long-lived connection, if it has one.
+
+    With optimize=True, run PRAGMA optimize first so the planner statistics
+    for job_history keep up as history accumulates across runs.
+    """
+    conn = getattr(_thread_local, "conn", None)
+    _thread_local.conn = None
+    if conn is not None:
+        _close_connection(conn, optimize)
+
+def close_worker_connections(opened, optimize=False):
+    """Close the connections init_worker_connection collected; call after the pool has shut down."""
+    while opened:
+        _close_connection(opened.pop(), optimize)
+
+@contextmanager
+def thread_connection(db_file=None):
+    """Keep one connection open for the calling thread for the duration of the block."""
+    if getattr(_thread_local, "conn", None) is not None:
+        # Already inside a long-lived connection scope (or a worker thread)
+        yield
+        return
+    init_worker_connection(db_file)
+    try:
+        yield
+    finally:
+        close_thread_connection(optimize=True)
+
 @contextmanager
 def db_connection(logger):
-    """Context manager for database connections to ensure proper cleanup."""
+    """Context manager for database connections to ensure proper cleanup.
+
+    Threads set up with init_worker_connection/thread_connection reuse their
+    thread-local connection, which is left open when the block exits. Work the
+    block did not commit is rolled back, as closing the connection would have.
+    """
     conn = None
+    owns_connection = False
     try:
-        conn = sqlite3.connect(str(Config.DB_FILE))
-        # Set a default busy timeout to prevent immediate errors when database is locked
-        conn.execute("PRAGMA busy_timeout = 3000")  # 3 seconds
+        conn = getattr(_thread_local, "conn", None)
+        if conn is not None and getattr(_thread_local, "db_file", None) != str(Config.DB_FILE):
+            # Config.DB_FILE was repointed since the thread connection was opened
+            conn = None
+        if conn is None:
+            conn = _connect(Config.DB_FILE)
+            owns_connection = True
         yield conn
     except sqlite3.Error as e:
         # Rollback any pending transaction before re-raising
@@ -40,11 +127,16 @@ def db_connection(logger):
         logger.error(f"Unexpected error: {e}")
         raise
     finally:
-        if conn is not None:
+        if conn is not None and owns_connection:
             try:
                 conn.close()
             except Exception as e:
                 logger.error(f"Error closing database connection: {e}")
+        elif conn is not None and conn.in_transaction:
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass  # Connection might be broken
 
 def init_db(verbose=False, logger=None):
     """Initialize the SQLite database with enhanced schema versioning and migration support."""
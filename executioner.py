@@ -10,40 +10,22 @@ like job timeout, email notifications, dry run mode, dependency validation, and
 """
 
 import json
-import subprocess
-import shlex
-import threading
-import sqlite3
 import logging
 import sys
 import datetime
 import os
-import re
-import smtplib
-import socket
-import time
 import argparse
-import ssl
-import signal
-import random
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from queue import Queue, Empty
-from typing import Dict, Set, List, Optional, Any, Tuple
-from logging.handlers import RotatingFileHandler
-from contextlib import contextmanager
-import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
 from pathlib import Path
 
 # Modularized imports
 from config.loader import Config
 from executioner_logging.setup import ensure_log_dir
-from db.sqlite_connection import db_connection, init_db
-from config.validator import validate_config
+from db.sqlite_connection import init_db
 from jobs.executioner import JobExecutioner
-from jobs.env_utils import parse_env_vars, substitute_env_vars_in_obj
+from jobs.json_utils import load_json_file
+from jobs.env_utils import parse_env_vars
 from jobs.logging_setup import setup_logging
+from jobs.state_manager import FAILED_STATUSES
 
 def parse_skip_jobs(skip_list):
     """Parse comma-separated job IDs. Supports both repeated and comma-separated formats."""
@@ -340,6 +322,9 @@ See README.md and docs/ directory in the project repository.
         print(f"{'Run':>7} | {'Attempt':>7} | {'Application':20} | {'Status':10} | {'Start Time':19} | {'Duration':>8} | {'Jobs':>12}")
         print("-" * 110)
 
+        # Color code status (only if terminal supports it)
+        use_color = sys.stdout.isatty() and os.environ.get('TERM') != 'dumb'
+        rows = []
         for run in recent_runs:
             run_id = run['run_id']
             attempt_id = run.get('attempt_id', 1)  # Default to 1 for old data
@@ -352,8 +337,7 @@ See README.md and docs/ directory in the project repository.
             # Format attempt display
             attempt_display = f"#{attempt_id}"
 
-            # Color code status (only if terminal supports it)
-            if sys.stdout.isatty() and os.environ.get('TERM') != 'dumb':
+            if use_color:
                 if status == 'SUCCESS':
                     status_display = f"\033[32m{status:10}\033[0m"  # Green
                 elif status in ['FAILED', 'ERROR']:
@@ -363,7 +347,8 @@ See README.md and docs/ directory in the project repository.
             else:
                 status_display = f"{status:10}"
 
-            print(f"{run_id:>7} | {attempt_display:>7} | {app_name:20} | {status_display} | {start_time:19} | {duration:>8} | {job_summary:>12}")
+            rows.append(f"{run_id:>7} | {attempt_display:>7} | {app_name:20} | {status_display} | {start_time:19} | {duration:>8} | {job_summary:>12}")
+        print("\n".join(rows))
 
         print("\nTo resume a failed run: executioner.py -c <config> --resume-from <RUN>")
         print("To resume only failed jobs: executioner.py -c <config> --resume-from <RUN> --resume-failed-only")
@@ -445,6 +430,7 @@ See README.md and docs/ directory in the project repository.
         print("-" * table_width)
 
         # Display all jobs in tabular format (ordered by execution time)
+        rows = []
         for job in jobs:
             # Format duration
             duration_str = "N/A"
@@ -462,7 +448,7 @@ See README.md and docs/ directory in the project repository.
             job_id = job['id'][:29] if len(job['id']) > 29 else job['id']
             attempt_str = f"#{job.get('attempt_id', 1)}"
 
-            print(f"{job_id:30} | {attempt_str:7} | {job['status']:8} | {start_time:19} | {end_time:19} | {duration_str:>8}")
+            rows.append(f"{job_id:30} | {attempt_str:7} | {job['status']:8} | {start_time:19} | {end_time:19} | {duration_str:>8}")
 
             # Display retry details if available
             retry_count = job.get('retry_count')
@@ -472,18 +458,20 @@ See README.md and docs/ directory in the project repository.
                     retry_data = json.loads(retry_history) if isinstance(retry_history, str) else retry_history
                     if retry_data and len(retry_data) > 0:
                         total_attempts = len(retry_data)
-                        print(f"  {'Retry Details:':30}   {total_attempts} total attempt(s), {retry_count} retry/retries")
+                        rows.append(f"  {'Retry Details:':30}   {total_attempts} total attempt(s), {retry_count} retry/retries")
                         for attempt in retry_data:
                             attempt_num = attempt.get('attempt', '?')
                             attempt_status = attempt.get('status', 'UNKNOWN')
                             attempt_duration = attempt.get('duration', 0)
                             attempt_timestamp = attempt.get('timestamp', 'N/A')[:19] if attempt.get('timestamp') else 'N/A'
                             attempt_exit_code = attempt.get('exit_code', 'N/A')
-                            print(f"     {'Attempt ' + str(attempt_num) + ':':30}   {attempt_status:8} ({attempt_duration:.2f}s) at {attempt_timestamp} - exit code {attempt_exit_code}")
+                            rows.append(f"     {'Attempt ' + str(attempt_num) + ':':30}   {attempt_status:8} ({attempt_duration:.2f}s) at {attempt_timestamp} - exit code {attempt_exit_code}")
                 except (json.JSONDecodeError, TypeError, ValueError, UnicodeEncodeError) as e:
                     # Silently skip malformed retry history or encoding errors
                     pass
 
+        if rows:
+            print("\n".join(rows))
         print()  # Add newline after table
 
         # Only show failed jobs and resume options if the final status is not SUCCESS
@@ -569,7 +557,7 @@ See README.md and docs/ directory in the project repository.
                 print(f"\nWarning: Job '{job_id}' not found in run {args.run_id}")
             elif current_statuses[job_id] == 'SUCCESS':
                 print(f"\nInfo: Job '{job_id}' is already marked as SUCCESS")
-            elif current_statuses[job_id] in ['FAILED', 'ERROR', 'TIMEOUT']:
+            elif current_statuses[job_id] in FAILED_STATUSES:
                 jobs_to_mark.append(job_id)
             else:
                 print(f"\nWarning: Job '{job_id}' has status '{current_statuses[job_id]}' - can only mark FAILED/ERROR/TIMEOUT jobs")
@@ -604,8 +592,7 @@ See README.md and docs/ directory in the project repository.
 
     # Load config file and set log dir BEFORE init_db or JobExecutioner
     try:
-        with open(args.config, 'r') as f:
-            config_data = json.load(f)
+        config_data = load_json_file(args.config)
     except FileNotFoundError:
         print(f"Error: Configuration file '{args.config}' not found.")
         print(f"Please check the file path or create the configuration file.")
@@ -10,14 +10,14 @@ def check_no_ora_errors(log_file):
     """Return True if the log file(s) do NOT contain any ORA- errors. Supports wildcards. Adds debug output."""
     logger = logging.getLogger("check_no_ora_errors")
     matched_files = glob.glob(log_file)
-    logger.debug(f"[DEBUG] check_no_ora_errors: log_file pattern: {log_file}")
-    logger.debug(f"[DEBUG] check_no_ora_errors: matched_files: {matched_files}")
+    logger.debug("[DEBUG] check_no_ora_errors: log_file pattern: %s", log_file)
+    logger.debug("[DEBUG] check_no_ora_errors: matched_files: %s", matched_files)
     if not matched_files:
         logger.error(f"[DEBUG] check_no_ora_errors: No files matched for pattern: {log_file}")
         return False
     for file_path in matched_files:
         try:
-            logger.debug(f"[DEBUG] check_no_ora_errors: Checking file: {file_path}")
+            logger.debug("[DEBUG] check_no_ora_errors: Checking file: %s", file_path)
             with open(file_path) as f:
                 for line in f:
                     if "ORA-" in line:
@@ -29,7 +29,7 @@ def check_no_ora_errors(log_file):
         except Exception as e:
             logger.error(f"[DEBUG] check_no_ora_errors: Unexpected error reading file {file_path}: {e}")
             return False
-    logger.debug(f"[DEBUG] check_no_ora_errors: No ORA- errors found in any matched files.")
+    logger.debug("[DEBUG] check_no_ora_errors: No ORA- errors found in any matched files.")
     return True
 
 def check_no_ora_or_sp2_errors(log_file):
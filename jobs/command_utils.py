@@ -1,20 +1,110 @@
 import shlex
 import os
 import re
+import logging
+from functools import lru_cache
 from typing import Tuple, Dict
 
+_SENSITIVE_FILES = ('/etc/passwd', '/etc/shadow', '/.ssh/', '/id_rsa', '/id_dsa',
+                    '/authorized_keys', '/known_hosts', '/.aws/', '/.config/', '/credentials')
+
+_CRITICAL_PATTERNS = [
+    (r'`.*`', "Backtick command substitution"),
+    (r'\$\(.*\)', "$() command substitution"),
+    (r'>\s*/etc/(\w+)', "Writing to /etc files"),
+    (r'>\s*/proc/(\w+)', "Writing to /proc"),
+    (r'>\s*/sys/(\w+)', "Writing to /sys"),
+    (r'[\s < /dev/null | &;]\s*rm\s+-rf\s+/', "Delete root directory"),
+    (r'[\s|&;]\s*rm\s+-rf\s+[~.]', "Delete home or current directory"),
+    (r'[\s|&;]\s*for\b.*\bdo\b.*\brm\b', "Loop for deletion"),
+    (r'\b(sudo|su|doas)\b', "Privilege escalation"),
+    (r'>\s*/dev/(sd|hd|xvd|nvme|fd|loop)', "Writing to raw devices"),
+    (r'\beval\b.*\$', "Eval with variables is extremely dangerous"),
+    (r'[\s|&;]\s*nc\s+.*\s+\-e\s+', "Netcat with program execution"),
+    (r'[\s|&;]\s*(shutdown|reboot|halt|poweroff)\b', "System power commands"),
+    (r'[\s|&;]\s*dd\s+.*\s+of=/dev/', "Writing to devices with dd"),
+    (r'\b(curl|wget)\b.*\|\s*(bash|sh)\b', "Piping web content directly to shell")
+]
+_MEDIUM_PATTERNS = [
+    (r'[;&\|]\s*rm\s+[-/]', "Dangerous rm commands"),
+    (r'[;&\|]\s*rm\s+.*\s+[~/]', "rm targeting home or root"),
+    (r'[;&\|]\s*mv\s+[^\s]+\s+/', "Moving to root"),
+    (r'[;&\|]\s*find\s+.*\s+(-exec\s+rm|\-delete)', "Find with delete"),
+    (r'[;&\|]\s*shred\b', "File secure deletion"),
+    (r'[;&\|]\s*chmod\s+([0-7])?777\b', "Overly permissive chmod"),
+    (r'[;&\|]\s*chmod\s+\-R\s+.*\s+[~/]', "Recursive chmod from sensitive locations"),
+    (r'[;&\|]\s*chown\s+\-R\s+.*\s+[~/]', "Recursive chown"),
+    (r'\beval\b', "Eval is dangerous"),
+    (r'\bexec\b\s*[^=]', "Exec (when not appearing in assignment)"),
+    (r'\bsocat\b.*exec', "Socat with execution"),
+    (r'[;&\|]\s*mkfs\b', "Filesystem creation"),
+    (r'[;&\|]\s*mount\b', "Mounting filesystems")
+]
+_HIGH_PATTERNS = [
+    (r'[;&\|]\s*truncate\s+.*\s+[~/]', "Truncate files in sensitive locations"),
+    (r'[;&\|]\s*sed\s+.*\s+-i\s+.*\s+[~/]', "Sed in-place editing of sensitive files"),
+    (r'\benv\b.*PATH=', "PATH manipulation"),
+    (r'\bwget\b.*\s+-O\s+[~/]', "Overwriting files with wget"),
+    (r'\bcurl\b.*\s+-o\s+[~/]', "Overwriting files with curl"),
+    (r'\bnohup\b', "Background processes with nohup"),
+    (r'\bscp\b.*\s+-r\b', "Recursive SCP"),
+    (r'\brsync\b.*\s+--delete\b', "Rsync with delete"),
+    (r'\bat\b', "Scheduled tasks"),
+    (r'\bcrontab\b', "Cron manipulation"),
+    (r'\biptables\b', "Firewall manipulation"),
+    (r'\broute\b', "Network routing"),
+    (r'\bsystemctl\b', "Service control"),
+    (r'\bjournalctl\b', "Log access"),
+    (r'\buseradd\b', "User management"),
+    (r'\busermod\b', "User modification"),
+    (r'\bchpasswd\b', "Password changing")
+]
+
+class _PatternCheck:
+    """Ordered (pattern, description) list with a compiled union used to reject clean commands in one pass."""
+
+    def __init__(self, patterns):
+        self.patterns = [(re.compile(pattern, re.IGNORECASE), description) for pattern, description in patterns]
+        self.union = re.compile("|".join(f"(?:{pattern})" for pattern, _ in patterns), re.IGNORECASE)
+
+    def first_match(self, command):
+        """Description of the first pattern, in list order, that matches command; None if none do."""
+        if not self.union.search(command):
+            return None
+        for pattern, description in self.patterns:
+            if pattern.search(command):
+                return description
+        return None
+
+_CRITICAL_CHECK = _PatternCheck(_CRITICAL_PATTERNS)
+_MEDIUM_CHECK = _PatternCheck(_MEDIUM_PATTERNS)
+_HIGH_CHECK = _PatternCheck(_HIGH_PATTERNS)
+
 def validate_command(command: str, job_id: str, job_logger, config) -> Tuple[bool, str]:
     if not command or not command.strip():
         return True, ""
-    security_policy = config.get("security_policy", "warn")
-    security_level = config.get("security_level", "medium")
-    command_whitelist = config.get("command_whitelist", [])
+    is_safe, reason, messages = _evaluate_command(
+        command,
+        config.get("security_policy", "warn"),
+        config.get("security_level", "medium"),
+        tuple(config.get("command_whitelist", [])),
+        tuple(config.get("workspace_paths", [])),
+        tuple(config.get("command_allowlist_patterns", []))
+    )
+    for level, message in messages:
+        job_logger.log(level, message)
+    return is_safe, reason
+
+@lru_cache(maxsize=256)
+def _evaluate_command(command: str, security_policy: str, security_level: str, command_whitelist: tuple,
+                      workspace_paths: tuple, allowlist_patterns: tuple) -> Tuple[bool, str, tuple]:
+    """Pure part of validate_command; log messages are returned so cached results can replay them."""
+    messages = []
     if command_whitelist:
         normalized_cmd = command.strip().split()[0] if command.strip() else ""
         if normalized_cmd in command_whitelist:
-            job_logger.info(f"Command '{normalized_cmd}' is in the whitelist")
-            return True, ""
-    workspace_paths = config.get("workspace_paths", [])
+            messages.append((logging.INFO, f"Command '{normalized_cmd}' is in the whitelist"))
+            return True, "", tuple(messages)
     try:
         tokens = shlex.split(command)
         if tokens:
@@ -23,99 +113,44 @@ def validate_command(command: str, job_id: str, job_logger, config) -> Tuple[boo
                 is_allowed_path = any(binary_name.startswith(path) for path in workspace_paths)
                 if not is_allowed_path:
                     reason = f"Command binary path outside of allowed workspace: {binary_name}"
-                    job_logger.warning(reason)
+                    messages.append((logging.WARNING, reason))
                     if security_policy == "block" or security_level == "high":
-                        return False, reason
+                        return False, reason, tuple(messages)
             for arg in tokens[1:]:
                 if '../' in arg or arg.startswith('..'):
                     reason = f"Suspicious path traversal detected in argument: {arg}"
-                    job_logger.warning(reason)
+                    messages.append((logging.WARNING, reason))
                     if security_policy == "block" or security_level == "high":
-                        return False, reason
-                sensitive_files = ['/etc/passwd', '/etc/shadow', '/.ssh/', '/id_rsa', '/id_dsa',
-                                 '/authorized_keys', '/known_hosts', '/.aws/', '/.config/', '/credentials']
-                for sensitive in sensitive_files:
+                        return False, reason, tuple(messages)
+                for sensitive in _SENSITIVE_FILES:
                     if sensitive in arg:
                         reason = f"Command appears to access sensitive file: {arg}"
-                        job_logger.warning(reason)
+                        messages.append((logging.WARNING, reason))
                         if security_policy == "block" or security_level == "high":
-                            return False, reason
+                            return False, reason, tuple(messages)
     except ValueError as e:
-        job_logger.warning(f"Command parsing failed: {e} - treating with caution")
-    critical_patterns = [
-        (r'`.*`', "Backtick command substitution"),
-        (r'\$\(.*\)', "$() command substitution"),
-        (r'>\s*/etc/(\w+)', "Writing to /etc files"),
-        (r'>\s*/proc/(\w+)', "Writing to /proc"),
-        (r'>\s*/sys/(\w+)', "Writing to /sys"),
-        (r'[\s < /dev/null | &;]\s*rm\s+-rf\s+/', "Delete root directory"),
-        (r'[\s|&;]\s*rm\s+-rf\s+[~.]', "Delete home or current directory"),
-        (r'[\s|&;]\s*for\b.*\bdo\b.*\brm\b', "Loop for deletion"),
-        (r'\b(sudo|su|doas)\b', "Privilege escalation"),
-        (r'>\s*/dev/(sd|hd|xvd|nvme|fd|loop)', "Writing to raw devices"),
-        (r'\beval\b.*\$', "Eval with variables is extremely dangerous"),
-        (r'[\s|&;]\s*nc\s+.*\s+\-e\s+', "Netcat with program execution"),
-        (r'[\s|&;]\s*(shutdown|reboot|halt|poweroff)\b', "System power commands"),
-        (r'[\s|&;]\s*dd\s+.*\s+of=/dev/', "Writing to devices with dd"),
-        (r'\b(curl|wget)\b.*\|\s*(bash|sh)\b', "Piping web content directly to shell")
-    ]
-    medium_patterns = [
-        (r'[;&\|]\s*rm\s+[-/]', "Dangerous rm commands"),
-        (r'[;&\|]\s*rm\s+.*\s+[~/]', "rm targeting home or root"),
-        (r'[;&\|]\s*mv\s+[^\s]+\s+/', "Moving to root"),
-        (r'[;&\|]\s*find\s+.*\s+(-exec\s+rm|\-delete)', "Find with delete"),
-        (r'[;&\|]\s*shred\b', "File secure deletion"),
-        (r'[;&\|]\s*chmod\s+([0-7])?777\b', "Overly permissive chmod"),
-        (r'[;&\|]\s*chmod\s+\-R\s+.*\s+[~/]', "Recursive chmod from sensitive locations"),
-        (r'[;&\|]\s*chown\s+\-R\s+.*\s+[~/]', "Recursive chown"),
-        (r'\beval\b', "Eval is dangerous"),
-        (r'\bexec\b\s*[^=]', "Exec (when not appearing in assignment)"),
-        (r'\bsocat\b.*exec', "Socat with execution"),
-        (r'[;&\|]\s*mkfs\b', "Filesystem creation"),
-        (r'[;&\|]\s*mount\b', "Mounting filesystems")
-    ]
-    high_patterns = [
-        (r'[;&\|]\s*truncate\s+.*\s+[~/]', "Truncate files in sensitive locations"),
-        (r'[;&\|]\s*sed\s+.*\s+-i\s+.*\s+[~/]', "Sed in-place editing of sensitive files"),
-        (r'\benv\b.*PATH=', "PATH manipulation"),
-        (r'\bwget\b.*\s+-O\s+[~/]', "Overwriting files with wget"),
-        (r'\bcurl\b.*\s+-o\s+[~/]', "Overwriting files with curl"),
-        (r'\bnohup\b', "Background processes with nohup"),
-        (r'\bscp\b.*\s+-r\b', "Recursive SCP"),
-        (r'\brsync\b.*\s+--delete\b', "Rsync with delete"),
-        (r'\bat\b', "Scheduled tasks"),
-        (r'\bcrontab\b', "Cron manipulation"),
-        (r'\biptables\b', "Firewall manipulation"),
-        (r'\broute\b', "Network routing"),
-        (r'\bsystemctl\b', "Service control"),
-        (r'\bjournalctl\b', "Log access"),
-        (r'\buseradd\b', "User management"),
-        (r'\busermod\b', "User modification"),
-        (r'\bchpasswd\b', "Password changing")
-    ]
-    allowlist_patterns = config.get("command_allowlist_patterns", [])
+        messages.append((logging.WARNING, f"Command parsing failed: {e} - treating with caution"))
     for allow_pattern in allowlist_patterns:
         if re.search(allow_pattern, command, re.IGNORECASE):
-            job_logger.info(f"Command matched allowlist pattern: {allow_pattern}")
-            return True, ""
-    for pattern, description in critical_patterns:
-        if re.search(pattern, command, re.IGNORECASE):
-            reason = f"Critical security violation: {description}"
-            job_logger.error(reason)
-            return False, reason
-    check_patterns = []
+            messages.append((logging.INFO, f"Command matched allowlist pattern: {allow_pattern}"))
+            return True, "", tuple(messages)
+    description = _CRITICAL_CHECK.first_match(command)
+    if description:
+        reason = f"Critical security violation: {description}"
+        messages.append((logging.ERROR, reason))
+        return False, reason, tuple(messages)
+    description = None
     if security_level in ("medium", "high"):
-        check_patterns.extend(medium_patterns)
-    if security_level == "high":
-        check_patterns.extend(high_patterns)
-    for pattern, description in check_patterns:
-        if re.search(pattern, command, re.IGNORECASE):
-            reason = f"Potentially unsafe operation: {description}"
-            job_logger.warning(reason)
-            if security_policy == "block":
-                return False, reason
-            return True, reason
-    return True, ""
+        description = _MEDIUM_CHECK.first_match(command)
+    if description is None and security_level == "high":
+        description = _HIGH_CHECK.first_match(command)
+    if description:
+        reason = f"Potentially unsafe operation: {description}"
+        messages.append((logging.WARNING, reason))
+        if security_policy == "block":
+            return False, reason, tuple(messages)
+        return True, reason, tuple(messages)
+    return True, "", tuple(messages)
 
 def parse_command(command: str, logger) -> Dict:
     if not command or not command.strip():
@@ -1,4 +1,5 @@
 import os
+from collections import deque
 
 class DependencyManager:
     def __init__(self, jobs, logger, dependency_plugins=None):
@@ -9,6 +10,13 @@ class DependencyManager:
             job["id"]: frozenset(job.get("dependencies", [])) for job in jobs.values()
         }
         self.dependency_resolvers = {}
+        # Reverse adjacency (job_id -> jobs that depend on it), built on first use
+        self._dependents = None
+        # Topological order from the last sort; dependencies are fixed after construction
+        self._execution_order = None
+        # Validation results (cycle flag, missing-dependency map), computed on first check
+        self._has_cycle = None
+        self._missing_dependencies = None
         # if self.dependency_plugins:
         #     self.logger.info(f"Found {len(self.dependency_plugins)} dependency plugins to load")
 
@@ -48,61 +56,88 @@ class DependencyManager:
         except Exception as e:
             self.logger.error(f"General error in dependency plugin loading: {e}")
 
-    def has_circular_dependencies(self):
-        def dfs(node, visited, recursion_stack, path=None):
-            if path is None:
-                path = []
-            visited.add(node)
-            recursion_stack.add(node)
-            path = path + [node]
-            for neighbor in self.dependencies.get(node, set()):
-                if neighbor not in self.jobs:
-                    self.logger.warning(f"Job '{node}' depends on '{neighbor}' which doesn't exist")
-                    continue
-                if neighbor not in visited:
-                    if dfs(neighbor, visited, recursion_stack, path):
-                        return True
-                elif neighbor in recursion_stack:
-                    cycle_path = path + [neighbor]
-                    self.logger.error(f"Circular dependency detected: {' -> '.join(cycle_path)}")
-                    return True
-            recursion_stack.remove(node)
-            return False
-        visited = set()
-        recursion_stack = set()
-        for job_id in self.jobs:
-            if job_id not in visited:
-                if dfs(job_id, visited, recursion_stack):
-                    return True
-        return False
+    def get_dependents(self, job_id):
+        """Return the jobs that directly depend on job_id."""
+        if self._dependents is None:
+            self._dependents = self._build_dependents()
+        return self._dependents.get(job_id, ())
 
-    def check_missing_dependencies(self):
-        result = {}
+    def _build_dependents(self):
+        dependents = {job_id: [] for job_id in self.jobs}
         for job_id, deps in self.dependencies.items():
-            missing = [dep for dep in deps if dep not in self.jobs]
-            if missing:
-                result[job_id] = missing
-        return result
+            for dep in deps:
+                if dep in dependents:
+                    dependents[dep].append(job_id)
+        return {job_id: tuple(children) for job_id, children in dependents.items()}
 
-    def get_execution_order(self):
+    def _topological_sort(self, warn_missing=False):
+        """Kahn's algorithm over existing jobs; jobs on or behind a cycle are left out."""
+        # Work on integer indexes so the inner loop is list indexing rather than dict lookups
+        idx2id = list(self.jobs)
+        id2idx = {job_id: idx for idx, job_id in enumerate(idx2id)}
+        in_degree = [0] * len(idx2id)
+        dependents_idx = [[] for _ in idx2id]
+        for idx, job_id in enumerate(idx2id):
+            for dep in self.dependencies.get(job_id, ()):
+                dep_idx = id2idx.get(dep)
+                if dep_idx is not None:
+                    in_degree[idx] += 1
+                    dependents_idx[dep_idx].append(idx)
+                elif warn_missing:
+                    self.logger.warning(f"Job '{job_id}' depends on '{dep}' which doesn't exist")
+        ready = deque(idx for idx, degree in enumerate(in_degree) if degree == 0)
         order = []
-        visited = set()
-        temp_visited = set()
-        def visit(node):
-            if node in temp_visited or node in visited:
-                return
-            temp_visited.add(node)
-            for dep in self.dependencies.get(node, []):
-                if dep in self.jobs:
-                    visit(dep)
-            temp_visited.remove(node)
-            visited.add(node)
-            order.append(node)
-        for job_id in self.jobs:
-            if job_id not in visited:
-                visit(job_id)
+        while ready:
+            idx = ready.popleft()
+            order.append(idx2id[idx])
+            for child in dependents_idx[idx]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready.append(child)
+        self._execution_order = order
         return order
 
+    def _find_cycle(self, unresolved):
+        """Follow dependencies among unresolved jobs until a job repeats; return the cycle path.
+
+        Starts at the first unresolved job in config order and takes the lowest-sorted
+        unresolved dependency at each step, so the reported cycle is stable across runs.
+        """
+        path = []
+        position = {}
+        node = next(job_id for job_id in self.jobs if job_id in unresolved)
+        while node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = min(dep for dep in self.dependencies[node] if dep in unresolved)
+        return path[position[node]:] + [node]
+
+    def has_circular_dependencies(self):
+        if self._has_cycle is None:
+            order = self._topological_sort(warn_missing=True)
+            self._has_cycle = len(order) != len(self.jobs)
+            if self._has_cycle:
+                unresolved = set(self.jobs) - set(order)
+                cycle_path = self._find_cycle(unresolved)
+                self.logger.error(f"Circular dependency detected: {' -> '.join(cycle_path)}")
+        return self._has_cycle
+
+    def check_missing_dependencies(self):
+        if self._missing_dependencies is None:
+            result = {}
+            for job_id, deps in self.dependencies.items():
+                missing = [dep for dep in deps if dep not in self.jobs]
+                if missing:
+                    result[job_id] = missing
+            self._missing_dependencies = result
+        return self._missing_dependencies
+
+    def get_execution_order(self):
+        """Return job IDs in dependency order (dependencies before dependents)."""
+        if self._execution_order is None:
+            self._topological_sort()
+        return list(self._execution_order)
+
     def get_job_dependencies(self, job_id):
         """Return the dependencies for a given job_id as a set."""
         return set(self.dependencies.get(job_id, set()))
@@ -91,7 +91,7 @@ def substitute_env_vars_in_obj(obj, env_vars, _seen=None, logger=None):
                 return result
             else:
                 if logger:
-                    logger.debug(f"No value found for variable: {var}")
+                    logger.debug("No value found for variable: %s", var)
                 return match.group(0)  # Leave as-is
         return pattern.sub(replacer, obj)
     else:
@@ -217,13 +217,13 @@ def filter_shell_env(inherit_shell_env, logger=None):
     elif inherit_shell_env == "default":
         # Use default whitelist
         if logger:
-            logger.debug(f"Inheriting default shell environment variables: {DEFAULT_INHERIT_ENV}")
+            logger.debug("Inheriting default shell environment variables: %s", DEFAULT_INHERIT_ENV)
         return {k: v for k, v in os.environ.items() if k in DEFAULT_INHERIT_ENV}
     
     elif isinstance(inherit_shell_env, list):
         # Use custom whitelist
         if logger:
-            logger.debug(f"Inheriting specified shell environment variables: {inherit_shell_env}")
+            logger.debug("Inheriting specified shell environment variables: %s", inherit_shell_env)
         return {k: v for k, v in os.environ.items() if k in inherit_shell_env}
     
     else:
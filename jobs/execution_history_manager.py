@@ -1,6 +1,7 @@
 import sqlite3
-import json
-from db.sqlite_connection import db_connection
+import queue
+import threading
+from db.sqlite_connection import db_connection, thread_connection
 from jobs.db_utils import handle_db_errors
 from jobs.json_utils import to_json
 
@@ -12,6 +13,12 @@ class ExecutionHistoryManager:
         self.attempt_id = attempt_id
         self.logger = logger
         self.job_status_batch = []
+        # SQLite allows one writer at a time even in WAL mode; worker threads queue on
+        # this lock instead of contending for the database lock inside busy_timeout
+        self._write_lock = threading.Lock()
+        # Set while the background retry-history writer is running
+        self._retry_queue = None
+        self._retry_writer = None
 
     def set_logger(self, logger):
         self.logger = logger
@@ -21,12 +28,13 @@ class ExecutionHistoryManager:
         """Get a new run ID for a fresh run (not a resume)"""
         with db_connection(self.logger) as conn:
             cursor = conn.cursor()
-            # Check both job_history and run_summary tables to get the highest run_id
+            # Check both job_history and run_summary tables to get the highest run_id.
+            # A bare MAX(run_id) per table is answered from the run_id index instead of a scan.
             cursor.execute("""
-                SELECT MAX(run_id) FROM (
-                    SELECT CAST(run_id AS INTEGER) as run_id FROM job_history
+                SELECT MAX(last_run_id) FROM (
+                    SELECT MAX(run_id) AS last_run_id FROM job_history
                     UNION ALL
-                    SELECT run_id FROM run_summary
+                    SELECT MAX(run_id) FROM run_summary
                 )
             """)
             last_run_id = cursor.fetchone()[0]
@@ -48,21 +56,15 @@ class ExecutionHistoryManager:
         """Create a new run summary entry with attempt tracking"""
         with db_connection(self.logger) as conn:
             cursor = conn.cursor()
-            try:
-                cursor.execute("""
-                    INSERT INTO run_summary (run_id, attempt_id, application_name, start_time, status, total_jobs, working_dir)
-                    VALUES (?, ?, ?, ?, 'RUNNING', ?, ?)
-                """, (run_id, attempt_id, application_name, start_time.strftime('%Y-%m-%d %H:%M:%S'), total_jobs, working_dir))
-                conn.commit()
-            except Exception as e:
-                # Handle the case where run_summary already exists (e.g., from previous run or race condition)
-                if "UNIQUE constraint failed" in str(e):
-                    self.logger.debug(f"Run summary already exists for run ID {run_id}, skipping creation")
-                    # Check if it's truly a duplicate or if we need to update
-                    cursor.execute("SELECT COUNT(*) FROM run_summary WHERE run_id = ?", (run_id,))
-                    if cursor.fetchone()[0] > 0:
-                        return  # Already exists, that's fine
-                raise  # Re-raise if it's a different error
+            # An existing row for this run/attempt (e.g. from a race) is left as is
+            cursor.execute("""
+                INSERT INTO run_summary (run_id, attempt_id, application_name, start_time, status, total_jobs, working_dir)
+                VALUES (?, ?, ?, ?, 'RUNNING', ?, ?)
+                ON CONFLICT (run_id, attempt_id) DO NOTHING
+            """, (run_id, attempt_id, application_name, start_time.strftime('%Y-%m-%d %H:%M:%S'), total_jobs, working_dir))
+            if cursor.rowcount == 0:
+                self.logger.debug(f"Run summary already exists for run ID {run_id}, skipping creation")
+            conn.commit()
 
     @handle_db_errors(lambda self: self.logger)
     def update_run_summary(self, run_id, attempt_id, end_time, status, completed_jobs, failed_jobs, skipped_jobs, exit_code):
@@ -81,27 +83,18 @@ class ExecutionHistoryManager:
     @handle_db_errors(lambda self: self.logger)
     def get_previous_run_status(self, run_id, attempt_id=None):
         """Get cumulative job statuses from all attempts of a run, using the latest status for each job."""
-        job_statuses = {}
         with db_connection(self.logger) as conn:
             cursor = conn.cursor()
-            # Get the cumulative status across ALL attempts - use the latest status for each job
+            # Get the cumulative status across ALL attempts - use the latest status for each job.
+            # With a lone MAX() aggregate SQLite takes the bare status column from the row
+            # holding the maximum, i.e. the latest attempt, so no per-job follow-up query is needed.
             cursor.execute("""
                 SELECT id, status, MAX(attempt_id) as latest_attempt
                 FROM job_history 
                 WHERE run_id = ?
                 GROUP BY id
             """, (run_id,))
-            
-            for row in cursor.fetchall():
-                job_id, status, latest_attempt = row
-                # Get the actual status from the latest attempt for this job
-                cursor.execute("""
-                    SELECT status FROM job_history 
-                    WHERE run_id = ? AND attempt_id = ? AND id = ?
-                """, (run_id, latest_attempt, job_id))
-                result = cursor.fetchone()
-                if result:
-                    job_statuses[job_id] = result[0]
+            job_statuses = {job_id: status for job_id, status, _ in cursor}
         current_jobs = set(self.jobs.keys())
         previous_jobs = set(job_statuses.keys())
         if current_jobs != previous_jobs:
@@ -649,8 +642,12 @@ class ExecutionHistoryManager:
     def commit_job_statuses(self):
         if not self.job_status_batch:
             return
-        with db_connection(self.logger) as conn:
+        with self._write_lock, db_connection(self.logger) as conn:
             cursor = conn.cursor()
+            # Take the write lock up front so a busy database waits in busy_timeout
+            # rather than failing partway through the batch
+            if not conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
             cursor.executemany("""
                 INSERT INTO job_history
                 (run_id, attempt_id, id, description, command, status, application_name, last_run, duration_seconds)
@@ -679,116 +676,129 @@ class ExecutionHistoryManager:
         'cpu_usage_percent': ('REAL', '')
     }
 
+    @classmethod
+    def migrate_job_history(cls, conn, logger):
+        """Add the retry/exit-code columns to job_history if missing; called once at run start."""
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(job_history)")
+        columns = {col[1] for col in cursor.fetchall()}
+        added = False
+        for col_name in ('retry_history', 'last_exit_code', 'retry_count', 'last_error'):
+            if col_name in columns:
+                continue
+            col_type, col_constraint = cls.ALLOWED_COLUMNS[col_name]
+            alter_sql = f"ALTER TABLE job_history ADD COLUMN {col_name} {col_type} {col_constraint}".rstrip()
+            try:
+                cursor.execute(alter_sql)
+                added = True
+                logger.info(f"Added missing column to job_history: {col_name} {col_type}")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" not in str(e):
+                    raise
+        if added:
+            conn.commit()
+
+    # Creates the row on first retry, otherwise only refreshes the retry fields;
+    # last_error is kept when no new reason is given
+    RETRY_UPSERT_SQL = """
+        INSERT INTO job_history
+        (run_id, attempt_id, id, description, command, status, application_name,
+         retry_count, retry_history, last_error)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (run_id, attempt_id, id) DO UPDATE SET
+            retry_count = excluded.retry_count,
+            retry_history = excluded.retry_history,
+            last_error = COALESCE(excluded.last_error, job_history.last_error)
+    """
+
     @handle_db_errors(lambda self: self.logger)
     def update_retry_history(self, job_id, retry_history, retry_count, status, reason=None):
-        with db_connection(self.logger) as conn:
-            retry_history_json = to_json(retry_history)
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(job_history)")
-            columns = [col[1] for col in cursor.fetchall()]
-            columns_to_add = []
-
-            # Check which allowed columns need to be added
-            for col_name, (col_type, col_constraint) in self.ALLOWED_COLUMNS.items():
-                if col_name in ['retry_history', 'last_exit_code', 'retry_count', 'last_error']:
-                    if col_name not in columns:
-                        columns_to_add.append((col_name, col_type, col_constraint))
-
-            if columns_to_add:
-                for col_name, col_type, col_constraint in columns_to_add:
-                    # Validate column name and type against whitelist
-                    if col_name not in self.ALLOWED_COLUMNS:
-                        self.logger.error(f"Attempted to add non-whitelisted column: {col_name}")
-                        continue
-
-                    # Build SQL with validated components
-                    if col_constraint:
-                        alter_sql = f"ALTER TABLE job_history ADD COLUMN {col_name} {col_type} {col_constraint}"
-                    else:
-                        alter_sql = f"ALTER TABLE job_history ADD COLUMN {col_name} {col_type}"
+        job = self.jobs[job_id]
+        row = (
+            self.run_id,
+            self.attempt_id,
+            job_id,
+            job.get("description", ""),
+            job["command"],
+            status,
+            self.application_name,
+            retry_count,
+            to_json(retry_history),
+            reason or None
+        )
+        if self._retry_queue is not None:
+            self._retry_queue.put(row)
+            self.logger.debug("Queued retry history for job %s: status=%s, retry_count=%s", job_id, status, retry_count)
+            return
+        self._write_retry_rows([row])
+        self.logger.debug("Updated retry history for job %s: status=%s, retry_count=%s", job_id, status, retry_count)
 
-                    try:
-                        cursor.execute(alter_sql)
-                        self.logger.info(f"Added missing column to job_history: {col_name} {col_type}")
-                    except sqlite3.OperationalError as e:
-                        if "duplicate column name" not in str(e):
-                            raise
-                conn.commit()
-            cursor.execute(
-                "SELECT 1 FROM job_history WHERE run_id = ? AND attempt_id = ? AND id = ?",
-                (self.run_id, self.attempt_id, job_id)
-            )
-            if not cursor.fetchone():
-                job = self.jobs[job_id]
-                cursor.execute(
-                    """
-                    INSERT INTO job_history
-                    (run_id, attempt_id, id, description, command, status, application_name)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        self.run_id,
-                        self.attempt_id,
-                        job_id,
-                        job.get("description", ""),
-                        job["command"],
-                        status,
-                        self.application_name
-                    )
-                )
-                conn.commit()
+    def _write_retry_rows(self, rows):
+        with self._write_lock, db_connection(self.logger) as conn:
+            cursor = conn.cursor()
+            # All rows share one write transaction
+            if not conn.in_transaction:
+                cursor.execute("BEGIN IMMEDIATE")
             try:
-                if reason:
-                    cursor.execute(
-                        """
-                        UPDATE job_history
-                        SET retry_count = ?, retry_history = ?, last_error = ?
-                        WHERE run_id = ? AND attempt_id = ? AND id = ?
-                        """,
-                        (retry_count, retry_history_json, reason, self.run_id, self.attempt_id, job_id)
-                    )
-                else:
-                    cursor.execute(
-                        """
-                        UPDATE job_history
-                        SET retry_count = ?, retry_history = ?
-                        WHERE run_id = ? AND attempt_id = ? AND id = ?
-                        """,
-                        (retry_count, retry_history_json, self.run_id, self.attempt_id, job_id)
-                    )
-                conn.commit()
+                cursor.executemany(self.RETRY_UPSERT_SQL, rows)
             except sqlite3.OperationalError as e:
                 self.logger.warning(f"Could not update retry history, possible schema issue: {e}")
-            self.logger.debug(f"Updated retry history for job {job_id}: status={status}, retry_count={retry_count}")
+            conn.commit()
+
+    def start_retry_writer(self):
+        """Send update_retry_history rows to a background thread that writes them in batches."""
+        if self._retry_writer is not None:
+            return
+        self._retry_queue = queue.SimpleQueue()
+        self._retry_writer = threading.Thread(
+            target=self._drain_retry_queue, name="retry-history-writer", daemon=True
+        )
+        self._retry_writer.start()
+
+    def stop_retry_writer(self):
+        """Flush the queued retry rows and stop the background writer."""
+        if self._retry_writer is None:
+            return
+        self._retry_queue.put(None)
+        self._retry_writer.join()
+        self._retry_writer = None
+        self._retry_queue = None
+
+    def _drain_retry_queue(self):
+        retry_queue = self._retry_queue
+        with thread_connection():
+            stopping = False
+            while not stopping:
+                # Block for the first row, then take whatever else has piled up meanwhile
+                batch = [retry_queue.get()]
+                while True:
+                    try:
+                        batch.append(retry_queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if None in batch:
+                    stopping = True
+                    batch = [row for row in batch if row is not None]
+                if not batch:
+                    continue
+                try:
+                    self._write_retry_rows(batch)
+                    self.logger.debug("Wrote retry history for %d jobs", len(batch))
+                except sqlite3.Error as e:
+                    self.logger.error(f"Database error in retry history writer: {e}")
 
     @handle_db_errors(lambda self: self.logger)
     def get_last_exit_code(self, job_id):
         with db_connection(self.logger) as conn:
             cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(job_history)")
-            columns = [col[1] for col in cursor.fetchall()]
-            if 'last_exit_code' not in columns:
-                # Validate column name against whitelist
-                if 'last_exit_code' in self.ALLOWED_COLUMNS:
-                    col_type, col_constraint = self.ALLOWED_COLUMNS['last_exit_code']
-                    try:
-                        cursor.execute("ALTER TABLE job_history ADD COLUMN last_exit_code INTEGER")
-                        conn.commit()
-                        self.logger.info("Added missing column to job_history: last_exit_code INTEGER")
-                    except sqlite3.OperationalError as e:
-                        if "duplicate column name" not in str(e):
-                            self.logger.warning(f"Could not add last_exit_code column: {e}")
-                else:
-                    self.logger.error("Attempted to add non-whitelisted column: last_exit_code")
-                return None
             try:
                 cursor.execute(
                     "SELECT last_exit_code FROM job_history WHERE run_id = ? AND attempt_id = ? AND id = ?",
                     (self.run_id, self.attempt_id, job_id)
                 )
                 row = cursor.fetchone()
-                if row and row[0] is not None:
-                    return int(row[0])
+                # INTEGER column: SQLite already hands back an int or None
+                return row[0] if row else None
             except sqlite3.OperationalError as e:
                 self.logger.debug(f"Error selecting last_exit_code: {e}")
             return None
@@ -9,18 +9,19 @@ This module provides the ExecutionOrchestrator class that handles:
 - Execution flow control and monitoring
 """
 
-import threading
 import logging
 import signal
-import time
-from typing import Dict, Set, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from queue import SimpleQueue, Empty
+from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, Future
 import concurrent.futures
 
 from config.loader import Config
+from db.sqlite_connection import init_worker_connection, close_worker_connections
 from jobs.queue_manager import QueueManager
 from jobs.state_manager import StateManager
 from jobs.dependency_manager import DependencyManager
+from jobs.summary_reporter import SUMMARY_DIVIDER
 
 
 class ExecutionOrchestrator:
@@ -69,6 +70,13 @@ class ExecutionOrchestrator:
         
         # Threading primitives for parallel execution
         self.executor: Optional[ThreadPoolExecutor] = None
+        # In-flight futures and the job each one runs; only the dispatch thread touches this
+        self.pending_futures: Dict[Future, str] = {}
+        # Queue the parallel loop blocks on; the SIGINT handler posts None to wake it
+        self._completion_queue: Optional[SimpleQueue] = None
+        
+        # Per-job execution plan fragments, built on the first dry run
+        self._plan_fragments: Optional[Dict[str, tuple]] = None
     
     def run_dry(self, resume_run_id: Optional[int] = None, resume_failed_only: bool = False) -> int:
         """
@@ -96,20 +104,9 @@ class ExecutionOrchestrator:
                 resume_mode = "failed jobs only" if resume_failed_only else "all incomplete jobs"
                 self.logger.info(f"Resuming run {original_run} (attempt {attempt_num}, {resume_mode})")
                 
-                # Apply resume logic to determine skip jobs
-                resume_skip_jobs = self.state_manager.determine_jobs_to_skip()
+                # Apply resume logic to determine skip jobs (logs what would be skipped/executed)
+                resume_skip_jobs = self.state_manager.determine_jobs_to_skip(dry_run=True)
                 self.queue_manager.set_skip_jobs(resume_skip_jobs)
-                
-                # Log what would be skipped/executed
-                for job_id, status in previous_job_statuses.items():
-                    if job_id not in self.jobs:
-                        continue
-                    if status == "SUCCESS":
-                        self.logger.info(f"Would skip previously successful job: {job_id}")
-                    elif resume_failed_only and status in ["FAILED", "ERROR", "TIMEOUT"]:
-                        self.logger.info(f"Would re-run previously failed job: {job_id}")
-                    elif not resume_failed_only and status not in ["FAILED", "ERROR", "TIMEOUT"]:
-                        self.logger.info(f"Would skip job with status {status}: {job_id}")
         
         # Validate dependencies
         if self.dependency_manager.has_circular_dependencies():
@@ -154,7 +151,7 @@ class ExecutionOrchestrator:
         while not self.queue_manager.is_queue_empty() and iteration_count < max_iter and not self.state_manager.is_interrupted():
             iteration_count += 1
             
-            job_id = self.queue_manager.get_next_job(timeout=1)
+            job_id = self.queue_manager.get_next_job()
             if job_id is None:
                 break
             
@@ -162,11 +159,11 @@ class ExecutionOrchestrator:
                 continue
             
             # Verify dependencies are still satisfied
-            deps = self.dependency_manager.get_job_dependencies(job_id)
-            missing_deps = [dep for dep in deps 
-                          if dep not in self.queue_manager.completed_jobs and dep not in self.queue_manager.skip_jobs]
+            deps = self.dependency_manager.dependencies.get(job_id, frozenset())
+            missing_deps = deps - self.queue_manager.completed_jobs - self.queue_manager.skip_jobs
             
             if missing_deps:
+                missing_deps = sorted(missing_deps)
                 if all(dep in self.jobs for dep in missing_deps):
                     self.logger.warning(f"Job {job_id} queued before dependencies were satisfied: {missing_deps}")
                     continue
@@ -189,16 +186,16 @@ class ExecutionOrchestrator:
                 self.logger.info("Execution interrupted, stopping gracefully.")
                 break
             
-            # Update job state
-            with self.queue_manager.lock:
-                if job_success:
-                    self.queue_manager.add_completed_job(job_id)
-                else:
-                    self.queue_manager.add_failed_job(job_id, fail_reason or "Unknown failure")
-                    if not self.state_manager.should_continue_on_error():
-                        self.state_manager.set_exit_code(1)
-                        break
-                    self.logger.warning(f"Job {job_id} failed but continuing.")
+            # Update job state (sequential mode has no other threads; the
+            # QueueManager methods take their own lock anyway)
+            if job_success:
+                self.queue_manager.add_completed_job(job_id)
+            else:
+                self.queue_manager.add_failed_job(job_id, fail_reason or "Unknown failure")
+                if not self.state_manager.should_continue_on_error():
+                    self.state_manager.set_exit_code(1)
+                    break
+                self.logger.warning(f"Job {job_id} failed but continuing.")
             
             # Queue dependent jobs if this job succeeded
             if job_success:
@@ -217,10 +214,18 @@ class ExecutionOrchestrator:
             Number of iterations performed
         """
         iteration_count = 0
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # Each worker's connection, closed here once the pool has shut down
+        worker_connections = []
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=init_worker_connection,
+            initargs=(Config.DB_FILE, worker_connections)
+        )
         self.logger.info(f"Parallel execution with {self.max_workers} workers")
         
-        pending_futures: Set[Future] = set()
+        pending_futures = self.pending_futures = {}
+        # Finished futures are pushed here by their done-callbacks
+        completion_queue = self._completion_queue = SimpleQueue()
         
         try:
             while ((not self.queue_manager.is_queue_empty() or pending_futures) 
@@ -228,82 +233,34 @@ class ExecutionOrchestrator:
                    and not self.state_manager.is_interrupted()):
                 
                 iteration_count += 1
-                just_completed_jobs: Set[str] = set()
-                
-                # Process completed futures
-                try:
-                    completed_futures = list(as_completed(pending_futures, timeout=0.1))
-                    for future in completed_futures:
-                        pending_futures.remove(future)
-                        
-                        with self.queue_manager.lock:
-                            job_id = self.queue_manager.unregister_future(future)
-                            if not job_id:
-                                continue
-                            
-                            try:
-                                job_success, fail_reason = future.result()
-                                if job_success:
-                                    self.queue_manager.add_completed_job(job_id)
-                                    just_completed_jobs.add(job_id)
-                                else:
-                                    self.queue_manager.add_failed_job(job_id, fail_reason or "Unknown failure")
-                                    if not self.state_manager.should_continue_on_error():
-                                        self.state_manager.set_exit_code(1)
-                                        self.state_manager.mark_interrupted()
-                                    else:
-                                        self.logger.warning(f"Job {job_id} failed but continuing.")
-                            except Exception as e:
-                                self.logger.error(f"Job {job_id} raised exception: {e}")
-                                self.queue_manager.add_failed_job(job_id, f"Exception: {e}")
-                                if not self.state_manager.should_continue_on_error():
-                                    self.state_manager.set_exit_code(1)
-                                    self.state_manager.mark_interrupted()
-                        
-                        # Notify other threads of completion
-                        with self.queue_manager.job_completed_condition:
-                            self.queue_manager.job_completed_condition.notify_all()
-                
-                except concurrent.futures.TimeoutError:
-                    pass
-                
-                # Queue dependent jobs for completed jobs
-                for job_id in just_completed_jobs:
-                    if not self.state_manager.is_interrupted():
-                        self.queue_manager.queue_dependent_jobs(job_id, self.state_manager.is_dry_run())
                 
                 # Submit new jobs
-                jobs_queued = 0
                 while not self.queue_manager.is_queue_empty() and not self.state_manager.is_interrupted():
                     available_worker_slots = self.max_workers - len(pending_futures)
                     if available_worker_slots <= 0:
                         break
                     
-                    job_id = self.queue_manager.get_next_job(timeout=0.1)
+                    job_id = self.queue_manager.get_next_job()
                     if job_id is None:
                         break
                     
-                    should_submit = False
-                    missing_deps = []
+                    # Job state is only mutated on this dispatching thread (workers report
+                    # back through completion_queue), so these reads need no lock
+                    if (job_id in self.queue_manager.skip_jobs or
+                        job_id in self.queue_manager.completed_jobs or
+                        job_id in self.queue_manager.active_jobs):
+                        continue
                     
-                    with self.queue_manager.lock:
-                        if (job_id in self.queue_manager.skip_jobs or
-                            job_id in self.queue_manager.completed_jobs or
-                            job_id in self.queue_manager.active_jobs):
-                            continue
-                        
-                        deps = self.dependency_manager.get_job_dependencies(job_id)
-                        missing_deps = [dep for dep in deps 
-                                      if dep not in self.queue_manager.completed_jobs and dep not in self.queue_manager.skip_jobs]
-                        
-                        if not missing_deps:
-                            should_submit = True
-                            self.queue_manager.add_active_job(job_id)
+                    deps = self.dependency_manager.dependencies.get(job_id, frozenset())
+                    missing_deps = deps - self.queue_manager.completed_jobs - self.queue_manager.skip_jobs
                     
                     if missing_deps:
+                        missing_deps = sorted(missing_deps)
                         if all(dep in self.jobs for dep in missing_deps):
-                            self.queue_manager.queue_job(job_id)
-                            break
+                            # Dependents are released by queue_dependents_batch once their
+                            # last dependency finishes, so there is nothing to retry here
+                            self.logger.warning(f"Job {job_id} queued before dependencies were satisfied: {missing_deps}")
+                            continue
                         
                         non_existent_deps = [dep for dep in missing_deps if dep not in self.jobs]
                         self.logger.warning(f"Job {job_id} has non-existent dependencies: {non_existent_deps}")
@@ -316,28 +273,55 @@ class ExecutionOrchestrator:
                         self.state_manager.mark_interrupted()
                         break
                     
-                    if should_submit:
-                        with self.queue_manager.lock:
-                            future = self.executor.submit(self.execute_job, job_id)
-                            pending_futures.add(future)
-                            self.queue_manager.register_future(future, job_id)
-                            self.logger.debug(f"Submitted job {job_id}")
-                            jobs_queued += 1
+                    self.queue_manager.add_active_job(job_id)
+                    future = self.executor.submit(self.execute_job, job_id)
+                    pending_futures[future] = job_id
+                    future.add_done_callback(completion_queue.put)
+                    self.logger.debug("Submitted job %s", job_id)
+                
+                if not pending_futures:
+                    continue
+                
+                # Block until a job finishes or SIGINT posts a wake-up; the timeout only
+                # bounds how long an interrupt flagged some other way goes unnoticed
+                try:
+                    completed_futures = [completion_queue.get(timeout=1.0)]
+                except Empty:
+                    continue
+                while True:
+                    try:
+                        completed_futures.append(completion_queue.get_nowait())
+                    except Empty:
+                        break
                 
-                # Wait for activity if nothing happened
-                if not completed_futures and not jobs_queued:
-                    with self.queue_manager.job_completed_condition:
-                        self.queue_manager.job_completed_condition.wait(timeout=1.0)
+                just_completed_jobs: List[str] = []
+                for future in completed_futures:
+                    job_id = pending_futures.pop(future, None)
+                    if not job_id:
+                        continue
+                    
+                    try:
+                        job_success, fail_reason = future.result()
+                        if job_success:
+                            self.queue_manager.add_completed_job(job_id)
+                            just_completed_jobs.append(job_id)
+                        else:
+                            self.queue_manager.add_failed_job(job_id, fail_reason or "Unknown failure")
+                            if not self.state_manager.should_continue_on_error():
+                                self.state_manager.set_exit_code(1)
+                                self.state_manager.mark_interrupted()
+                            else:
+                                self.logger.warning(f"Job {job_id} failed but continuing.")
+                    except Exception as e:
+                        self.logger.error(f"Job {job_id} raised exception: {e}")
+                        self.queue_manager.add_failed_job(job_id, f"Exception: {e}")
+                        if not self.state_manager.should_continue_on_error():
+                            self.state_manager.set_exit_code(1)
+                            self.state_manager.mark_interrupted()
                 
-                # Periodic status logging
-                if iteration_count % 10 == 0:
-                    with self.queue_manager.lock:
-                        status_summary = self.queue_manager.get_status_summary()
-                        self.logger.debug(
-                            f"Execution status - Queue: {self.queue_manager.get_queue_size()}, "
-                            f"Active: {status_summary['active']}, Completed: {status_summary['completed']}, "
-                            f"Failed: {status_summary['failed']}, Skipped: {status_summary['skipped']}"
-                        )
+                # Queue dependents of everything that finished this round in one pass
+                if just_completed_jobs and not self.state_manager.is_interrupted():
+                    self.queue_manager.queue_dependents_batch(just_completed_jobs, self.state_manager.is_dry_run())
             
             # Wait for remaining jobs to complete
             if pending_futures:
@@ -348,56 +332,48 @@ class ExecutionOrchestrator:
                 self.logger.debug("Shutting down thread pool executor")
                 self.executor.shutdown(wait=True)
                 self.executor = None
+            close_worker_connections(worker_connections, optimize=True)
+            self._completion_queue = None
         
         return iteration_count
     
-    def _wait_for_remaining_jobs(self, pending_futures: Set[Future]) -> None:
+    def _wait_for_remaining_jobs(self, pending_futures: Dict[Future, str]) -> None:
         """Wait for remaining parallel jobs to complete with timeout."""
         self.logger.info(f"Waiting for {len(pending_futures)} active jobs to complete...")
         
-        futures_to_wait = list(pending_futures)
         max_wait_time = 30
-        start_wait = time.time()
-        
-        while futures_to_wait and (time.time() - start_wait < max_wait_time):
-            try:
-                done, futures_to_wait = concurrent.futures.wait(
-                    futures_to_wait, timeout=1.0, return_when=concurrent.futures.FIRST_COMPLETED
-                )
-                
-                for future in done:
-                    with self.queue_manager.lock:
-                        job_id = self.queue_manager.unregister_future(future)
-                        if not job_id:
-                            continue
-                        
-                        pending_futures.discard(future)
-                        
-                        try:
-                            job_success, fail_reason = future.result()
-                            if job_success:
-                                self.queue_manager.add_completed_job(job_id)
-                            else:
-                                self.queue_manager.add_failed_job(job_id, fail_reason or "Unknown failure")
-                        except Exception as e:
-                            self.logger.error(f"Exception in job {job_id} during shutdown: {e}")
-                            self.queue_manager.add_failed_job(job_id, f"Exception: {e}")
+        try:
+            done, not_done = concurrent.futures.wait(
+                list(pending_futures), timeout=max_wait_time, return_when=concurrent.futures.ALL_COMPLETED
+            )
+        except Exception as e:
+            self.logger.error(f"Error waiting for jobs during shutdown: {e}")
+            done, not_done = set(), set(pending_futures)
+        
+        for future in done:
+            job_id = pending_futures.pop(future, None)
+            if not job_id:
+                continue
             
+            try:
+                job_success, fail_reason = future.result()
+                if job_success:
+                    self.queue_manager.add_completed_job(job_id)
+                else:
+                    self.queue_manager.add_failed_job(job_id, fail_reason or "Unknown failure")
             except Exception as e:
-                self.logger.error(f"Error waiting for jobs during shutdown: {e}")
-                break
+                self.logger.error(f"Exception in job {job_id} during shutdown: {e}")
+                self.queue_manager.add_failed_job(job_id, f"Exception: {e}")
         
         # Cancel remaining jobs if timeout exceeded
-        if futures_to_wait:
-            self.logger.warning(f"Abandoning {len(futures_to_wait)} jobs after {max_wait_time}s")
-            with self.queue_manager.lock:
-                for future in futures_to_wait:
-                    future.cancel()
-                    job_id = self.queue_manager.unregister_future(future)
-                    if job_id:
-                        self.queue_manager.add_failed_job(job_id, "Abandoned during shutdown")
-                        pending_futures.discard(future)
-                        self.logger.warning(f"Job {job_id} abandoned during shutdown")
+        if not_done:
+            self.logger.warning(f"Abandoning {len(not_done)} jobs after {max_wait_time}s")
+            for future in not_done:
+                future.cancel()
+                job_id = pending_futures.pop(future, None)
+                if job_id:
+                    self.queue_manager.add_failed_job(job_id, "Abandoned during shutdown")
+                    self.logger.warning(f"Job {job_id} abandoned during shutdown")
     
     def _display_execution_plan(self) -> None:
         """Display the execution plan for dry run."""
@@ -407,7 +383,8 @@ class ExecutionOrchestrator:
             parallel_text += f"{Config.COLOR_MAGENTA}PARALLEL with {self.max_workers} workers{Config.COLOR_RESET}"
         else:
             parallel_text += f"{Config.COLOR_BLUE}SEQUENTIAL{Config.COLOR_RESET}"
-        print(f"\n{parallel_text}")
+        # The whole plan is collected here and written with a single print
+        lines = [f"\n{parallel_text}"]
         
         # Application environment variables
         app_env_vars = getattr(self.state_manager, 'app_env_variables', {})
@@ -416,36 +393,52 @@ class ExecutionOrchestrator:
         
         if app_env_vars:
             sorted_vars = sorted(app_env_vars.keys())
-            print(f"\n{Config.COLOR_CYAN}Application environment variables:{Config.COLOR_RESET}")
-            print(f"{Config.COLOR_MAGENTA}{', '.join(sorted_vars)}{Config.COLOR_RESET}")
+            lines.append(f"\n{Config.COLOR_CYAN}Application environment variables:{Config.COLOR_RESET}")
+            lines.append(f"{Config.COLOR_MAGENTA}{', '.join(sorted_vars)}{Config.COLOR_RESET}")
         
         # Job execution order
-        print(f"\n{Config.COLOR_CYAN}Job execution order:{Config.COLOR_RESET}")
-        execution_order = self.dependency_manager.get_execution_order()
+        reset, yellow, green = Config.COLOR_RESET, Config.COLOR_YELLOW, Config.COLOR_DARK_GREEN
+        skip_jobs = self.queue_manager.skip_jobs
+        fragments = self._get_plan_fragments()
         
-        for i, job_id in enumerate(execution_order):
-            job = self.jobs[job_id]
-            job_desc = job.get("description", "")
-            
-            # Environment variables info
-            env_vars_info = ""
-            if job.get("env_variables"):
-                env_vars = ', '.join(job['env_variables'].keys())
-                env_vars_info = f" {Config.COLOR_MAGENTA}[ENV: {env_vars}]{Config.COLOR_RESET}"
-            
-            # Dependencies info
-            deps = self.dependency_manager.get_job_dependencies(job_id)
-            deps_info = f" {Config.COLOR_CYAN}[DEPS: {', '.join(deps) or 'none'}]{Config.COLOR_RESET}"
+        lines.append(f"\n{Config.COLOR_CYAN}Job execution order:{reset}")
+        for i, job_id in enumerate(self.dependency_manager.get_execution_order(), 1):
+            job_desc, command_info, env_deps_info = fragments[job_id]
             
             # Skip status or command preview
-            if job_id in self.queue_manager.skip_jobs:
-                print(f"{i+1}. {Config.COLOR_YELLOW}{job_id}{Config.COLOR_RESET} - {job_desc} "
-                      f"{Config.COLOR_YELLOW}[SKIPPED]{Config.COLOR_RESET}{env_vars_info}{deps_info}")
+            if job_id in skip_jobs:
+                lines.append(f"{i}. {yellow}{job_id}{reset} - {job_desc} "
+                             f"{yellow}[SKIPPED]{reset}{env_deps_info}")
             else:
+                lines.append(f"{i}. {green}{job_id}{reset} - {job_desc} - {command_info}{env_deps_info}")
+        print("\n".join(lines))
+    
+    def _get_plan_fragments(self) -> Dict[str, tuple]:
+        """Return (description, command preview, env/deps info) per job, computed once."""
+        if self._plan_fragments is None:
+            cyan, reset = Config.COLOR_CYAN, Config.COLOR_RESET
+            blue, magenta = Config.COLOR_BLUE, Config.COLOR_MAGENTA
+            dependencies = self.dependency_manager.dependencies
+            fragments = {}
+            for job_id, job in self.jobs.items():
                 command = job["command"]
                 command_preview = command[:40] + '...' if len(command) > 40 else command
-                print(f"{i+1}. {Config.COLOR_DARK_GREEN}{job_id}{Config.COLOR_RESET} - {job_desc} - "
-                      f"{Config.COLOR_BLUE}{command_preview}{Config.COLOR_RESET}{env_vars_info}{deps_info}")
+                
+                # Environment variables info
+                env_vars_info = ""
+                if job.get("env_variables"):
+                    env_vars_info = f" {magenta}[ENV: {', '.join(job['env_variables'])}]{reset}"
+                
+                # Dependencies info
+                deps_info = f" {cyan}[DEPS: {', '.join(dependencies.get(job_id, ())) or 'none'}]{reset}"
+                
+                fragments[job_id] = (
+                    job.get("description", ""),
+                    f"{blue}{command_preview}{reset}",
+                    env_vars_info + deps_info,
+                )
+            self._plan_fragments = fragments
+        return self._plan_fragments
     
     def _display_dry_run_summary(self) -> None:
         """Display the dry run execution summary."""
@@ -454,8 +447,8 @@ class ExecutionOrchestrator:
         start_time_str = timing_info["start_time_str"]
         end_time_str = timing_info["end_time_str"]
         
-        divider = f"{Config.COLOR_CYAN}{'='*40}{Config.COLOR_RESET}"
-        print(f"\n{divider}")
+        cyan, reset = Config.COLOR_CYAN, Config.COLOR_RESET
+        divider = SUMMARY_DIVIDER
         
         # Show appropriate title based on resume status
         if self.state_manager.resume_run_id:
@@ -463,28 +456,36 @@ class ExecutionOrchestrator:
         else:
             title = 'DRY RUN EXECUTION SUMMARY'
         
-        print(f"{Config.COLOR_CYAN}{title:^40}{Config.COLOR_RESET}")
-        print(f"{divider}")
-        print(f"{Config.COLOR_CYAN}Application:{Config.COLOR_RESET} {self.application_name}")
+        lines = [
+            "",
+            divider,
+            f"{cyan}{title:^40}{reset}",
+            divider,
+            f"{cyan}Application:{reset} {self.application_name}",
+        ]
         
         # Show original run or current run ID appropriately
         if self.state_manager.resume_run_id:
-            print(f"{Config.COLOR_CYAN}Original Run:{Config.COLOR_RESET} {self.state_manager.resume_run_id}")
-            print(f"{Config.COLOR_CYAN}Tracking ID:{Config.COLOR_RESET} {self.state_manager.run_id} {Config.COLOR_CYAN}(internal){Config.COLOR_RESET}")
+            lines.append(f"{cyan}Original Run:{reset} {self.state_manager.resume_run_id}")
+            lines.append(f"{cyan}Tracking ID:{reset} {self.state_manager.run_id} {cyan}(internal){reset}")
         else:
-            print(f"{Config.COLOR_CYAN}Run ID:{Config.COLOR_RESET} {self.state_manager.run_id}")
-        print(f"{Config.COLOR_CYAN}Start Time:{Config.COLOR_RESET} {start_time_str}")
-        print(f"{Config.COLOR_CYAN}End Time:{Config.COLOR_RESET} {end_time_str}")
-        print(f"{Config.COLOR_CYAN}Duration:{Config.COLOR_RESET} {duration_str}")
-        print(f"{Config.COLOR_CYAN}Total Jobs:{Config.COLOR_RESET} {len(self.jobs)}")
+            lines.append(f"{cyan}Run ID:{reset} {self.state_manager.run_id}")
         
         skip_count = len(self.queue_manager.skip_jobs)
         execute_count = len(self.jobs) - skip_count
         
-        print(f"{Config.COLOR_CYAN}Would Execute:{Config.COLOR_RESET} {Config.COLOR_DARK_GREEN}{execute_count}{Config.COLOR_RESET}")
-        print(f"{Config.COLOR_CYAN}Would Skip:{Config.COLOR_RESET} {Config.COLOR_YELLOW if skip_count > 0 else ''}{skip_count}{Config.COLOR_RESET}")
-        print(f"{divider}")
-        print("\n")
+        lines.extend((
+            f"{cyan}Start Time:{reset} {start_time_str}",
+            f"{cyan}End Time:{reset} {end_time_str}",
+            f"{cyan}Duration:{reset} {duration_str}",
+            f"{cyan}Total Jobs:{reset} {len(self.jobs)}",
+            f"{cyan}Would Execute:{reset} {Config.COLOR_DARK_GREEN}{execute_count}{reset}",
+            f"{cyan}Would Skip:{reset} {Config.COLOR_YELLOW if skip_count > 0 else ''}{skip_count}{reset}",
+            divider,
+            "",
+            "",
+        ))
+        print("\n".join(lines))
     
     def setup_interrupt_handler(self, dry_run: bool = False) -> Any:
         """
@@ -503,6 +504,10 @@ class ExecutionOrchestrator:
                 print("\nInterrupt received. Stopping dry run cleanly...")
             else:
                 print("\nInterrupt received. Will stop after current job completes...")
+            # SimpleQueue.put is reentrant, so it is safe to call from a signal handler
+            completion_queue = self._completion_queue
+            if completion_queue is not None:
+                completion_queue.put(None)
         
         original_handler = signal.getsignal(signal.SIGINT)
         signal.signal(signal.SIGINT, handle_keyboard_interrupt)
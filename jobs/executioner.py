@@ -1,47 +1,28 @@
 import json
-import subprocess
-import shlex
-import threading
 import logging
 import sys
 import datetime
 import os
-import re
-import glob
-
-import smtplib
-import socket
-import time
-import ssl
-import signal
-import random
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from queue import Queue, Empty
-from typing import Dict, Set, List, Optional, Any, Tuple
-from logging.handlers import RotatingFileHandler
-from contextlib import contextmanager
-import concurrent.futures
-from concurrent.futures import ThreadPoolExecutor, Future, as_completed
-from pathlib import Path
-import sqlite3
+from typing import Deque, Dict, Set, Optional, Any, Tuple
+from concurrent.futures import Future
 
 from config.loader import Config
-from db.sqlite_connection import db_connection
+from db.sqlite_connection import db_connection, thread_connection
 from config.validator import validate_config
-from jobs.checks import CHECK_REGISTRY  # Ensure visibility in all contexts
+from jobs.json_utils import load_json_file
 from jobs.job_runner import JobRunner
 from jobs.logging_setup import setup_logging, setup_job_logger
 from jobs.execution_history_manager import ExecutionHistoryManager
 from jobs.dependency_manager import DependencyManager
 
 from jobs.notification_manager import NotificationManager
-from jobs.command_utils import validate_command, parse_command
 from jobs.env_utils import merge_env_vars, interpolate_env_vars, filter_shell_env
 from jobs.queue_manager import QueueManager
 from jobs.state_manager import StateManager
 from jobs.execution_orchestrator import ExecutionOrchestrator
-from jobs.summary_reporter import SummaryReporter
+from jobs.summary_reporter import SummaryReporter, SUMMARY_DIVIDER, SUMMARY_HEADER
+
+_BANNER_DIVIDER = f"{Config.COLOR_CYAN}{'='*90}{Config.COLOR_RESET}"
 
 class JobExecutioner:
     def __init__(self, config_file: str, working_dir: str = None):
@@ -56,30 +37,33 @@ class JobExecutioner:
         # self.logger.propagate = False
         # Load and validate configuration
         try:
-            with open(str(config_file), "r") as file:
-                self.config = json.load(file)
+            self.config = load_json_file(config_file)
         except FileNotFoundError:
             print(f"Configuration file '{config_file}' not found.")
             sys.exit(1)
         except json.JSONDecodeError as e:
             print(f"Configuration file '{config_file}' contains invalid JSON: {e}")
             sys.exit(1)
+        config = self.config
         # Initialize necessary attributes for logging setup
-        self.application_name = self.config.get("application_name",
+        self.application_name = config.get("application_name",
             os.path.splitext(os.path.basename(config_file))[0])
 
         # Validate configuration schema before accessing jobs
         # Use a temporary logger for validation errors
         temp_logger = setup_logging(self.application_name, "main")
-        validate_config(self.config, temp_logger)
+        validate_config(config, temp_logger)
+        self.jobs: Dict[str, Dict] = {}
         try:
-            self.jobs: Dict[str, Dict] = {job["id"]: job for job in self.config["jobs"]}
+            for job in config["jobs"]:
+                job_id = job["id"]
+                if job_id in self.jobs:
+                    temp_logger.error(f"Duplicate job ID found in configuration: {job_id}")
+                    sys.exit(1)
+                self.jobs[job_id] = job
         except KeyError:
             temp_logger.error("Configuration is missing required 'jobs' list.")
             sys.exit(1)
-        if len(self.jobs) != len(self.config["jobs"]):
-            print("Duplicate job IDs found in configuration")
-            sys.exit(1)
 
         # Initialize ExecutionHistoryManager and StateManager
         self.job_history = ExecutionHistoryManager(self.jobs, self.application_name, None, temp_logger)
@@ -91,13 +75,14 @@ class JobExecutioner:
         self.job_history.set_logger(self.logger)
 
         # Email notification settings
-        self.email_address = self.config.get("email_address", "")
-        self.email_on_success = self.config.get("email_on_success", False)
-        self.email_on_failure = self.config.get("email_on_failure", True)
-        self.smtp_server = self.config.get("smtp_server", "localhost")
-        self.smtp_port = self.config.get("smtp_port", 587)  # Default to TLS port
-        self.smtp_user = self.config.get("smtp_user", "")
-        self.smtp_password = self.config.get("smtp_password", "")
+        self.email_address = config.get("email_address", "")
+        self.email_on_success = config.get("email_on_success", False)
+        self.email_on_failure = config.get("email_on_failure", True)
+        self.smtp_server = config.get("smtp_server", "localhost")
+        self.smtp_port = config.get("smtp_port", 587)  # Default to TLS port
+        self.smtp_user = config.get("smtp_user", "")
+        self.smtp_password = config.get("smtp_password", "")
+        self._email_valid = self._has_valid_email()
         # Notification manager
         self.notification_manager = NotificationManager(
             email_address=self.email_address,
@@ -112,31 +97,37 @@ class JobExecutioner:
         )
 
         # Execution settings
-        self.parallel = self.config.get("parallel", False)
-        self.max_workers = self.config.get("max_workers", 1)
-        self.allow_shell = self.config.get("allow_shell", True)  # New: Control shell execution
+        self.parallel = config.get("parallel", False)
+        self.max_workers = config.get("max_workers", 1)
+        self.allow_shell = config.get("allow_shell", True)  # New: Control shell execution
         if self.max_workers <= 0:
             self.max_workers = 1
+        cpu_count = os.cpu_count() or 1
+        if self.parallel and self.max_workers > cpu_count * 2:
+            # Not clamped: jobs that mostly wait on I/O can use more workers than cores
+            self.logger.warning(
+                f"max_workers={self.max_workers} is more than twice the {cpu_count} available CPUs; "
+                "CPU-bound jobs will contend for cores")
+        # Queue retry-history writes to one background writer; only worthwhile for parallel runs
+        self.batch_history_writes = self.parallel and config.get("batch_history_writes", False)
 
         # Environment variables
-        self.app_env_variables = self.config.get("env_variables", {})
+        self.app_env_variables = config.get("env_variables", {})
         # Interpolate application-level environment variables
         self.app_env_variables = interpolate_env_vars(self.app_env_variables, self.logger)
         self.cli_env_variables = {}  # Will be set by main executioner
 
         # Shell environment inheritance setting (default to True for backward compatibility)
-        self.inherit_shell_env = self.config.get("inherit_shell_env", True)
+        self.inherit_shell_env = config.get("inherit_shell_env", True)
         self.shell_env = filter_shell_env(self.inherit_shell_env, self.logger)
+        self._base_job_env = None  # Built on first job; CLI env vars are set after __init__
+        self._runner_kwargs = None
 
         # Handle dependency plugins if specified
-        self.dependency_plugins = self.config.get("dependency_plugins", [])
+        self.dependency_plugins = config.get("dependency_plugins", [])
 
-        # Job and dependency setup
-        self.jobs: Dict[str, Dict] = {job["id"]: job for job in self.config["jobs"]}
-        if len(self.jobs) != len(self.config["jobs"]):
-            self.logger.error("Duplicate job IDs found in configuration")
-            sys.exit(1)
-        self.dependency_manager = DependencyManager(self.jobs, self.logger, self.config.get("dependency_plugins", []))
+        # Dependency setup (self.jobs was built, and checked for duplicate IDs, above)
+        self.dependency_manager = DependencyManager(self.jobs, self.logger, self.dependency_plugins)
 
         # Initialize queue manager for job state and queue operations
         self.queue_manager = QueueManager(self.dependency_manager, self.logger)
@@ -163,7 +154,6 @@ class JobExecutioner:
 
         # Threading primitives (kept for backward compatibility and executor management)
         self.lock = self.queue_manager.lock  # Use queue manager's lock
-        self.job_completed_condition = self.queue_manager.job_completed_condition
         self.executor = None
 
         # Validate dependencies
@@ -175,10 +165,11 @@ class JobExecutioner:
             sys.exit(1)
 
         self.job_log_paths = {}  # Track job log file paths
+        self._set_job_log_naming()
 
     # Properties for backward compatibility - delegate to queue manager
     @property
-    def job_queue(self) -> Queue:
+    def job_queue(self) -> Deque[str]:
         """Access to the job queue."""
         return self.queue_manager.job_queue
 
@@ -209,8 +200,8 @@ class JobExecutioner:
 
     @property
     def future_to_job_id(self) -> Dict[Future, str]:
-        """Access to future-to-job-id mapping."""
-        return self.queue_manager.future_to_job_id
+        """Access to the in-flight future-to-job-id mapping of the current parallel run."""
+        return self.execution_orchestrator.pending_futures
 
     @property
     def skip_jobs(self) -> Set[str]:
@@ -312,11 +303,19 @@ class JobExecutioner:
                 self.logger.error(f"Job '{job['id']}' has invalid dependencies")
                 sys.exit(1)
 
+    def _set_job_log_naming(self) -> None:
+        """Fix the per-run parts of job log paths so _setup_job_logger only concatenates."""
+        self._job_log_prefix = f"executioner.{self.application_name}.job-"
+        self._job_log_suffix = f".run-{self.run_id}.log"
+        self._job_log_dirs_made: Set[str] = set()
+
     def _setup_job_logger(self, job_id: str) -> Tuple[logging.Logger, logging.FileHandler, str]:
         job = self.jobs[job_id]
         job_log_dir = job.get("log_dir", Config.LOG_DIR)
-        os.makedirs(job_log_dir, exist_ok=True)
-        job_log_path = os.path.join(job_log_dir, f"executioner.{self.application_name}.job-{job_id}.run-{self.run_id}.log")
+        if job_log_dir not in self._job_log_dirs_made:
+            os.makedirs(job_log_dir, exist_ok=True)
+            self._job_log_dirs_made.add(job_log_dir)
+        job_log_path = os.path.join(job_log_dir, self._job_log_prefix + job_id + self._job_log_suffix)
         job_logger, job_file_handler = setup_job_logger(self.application_name, self.run_id, job_id, job_log_path)
         job_description = job.get('description', '')
         job_command = job['command']
@@ -326,59 +325,77 @@ class JobExecutioner:
 
 
 
+    def _get_runner_kwargs(self) -> Dict[str, Any]:
+        """JobRunner arguments that are the same for every job, bound once per run."""
+        if self._runner_kwargs is None:
+            self._runner_kwargs = dict(
+                global_env=self.app_env_variables,
+                main_logger=self.logger,
+                config=self.config,
+                run_id=self.run_id,
+                app_name=self.application_name,
+                db_connection=db_connection,
+                update_job_status=self.job_history.update_job_status,
+                update_retry_history=self.job_history.update_retry_history,
+                get_last_exit_code=self.job_history.get_last_exit_code,
+                setup_job_logger=self._setup_job_logger,
+                cli_env=self.cli_env_variables,
+                shell_env=self.shell_env,
+                base_env=self._get_base_job_env()
+            )
+        return self._runner_kwargs
+
     def _execute_job(self, job_id: str, return_reason: bool = True):
-        job = self.jobs[job_id]
-        runner = JobRunner(
-            job_id=job_id,
-            job_config=job,
-            global_env=self.app_env_variables,
-            main_logger=self.logger,
-            config=self.config,
-            run_id=self.run_id,
-            app_name=self.application_name,
-            db_connection=db_connection,
-            update_job_status=self.job_history.update_job_status,
-            update_retry_history=self.job_history.update_retry_history,
-            get_last_exit_code=self.job_history.get_last_exit_code,
-            setup_job_logger=self._setup_job_logger,
-            cli_env=self.cli_env_variables,
-            shell_env=self.shell_env
-        )
+        runner = JobRunner(job_id=job_id, job_config=self.jobs[job_id], **self._get_runner_kwargs())
         runner.job_history = self.job_history
         result, fail_reason = runner.run(dry_run=self.dry_run, continue_on_error=self.continue_on_error, return_reason=True)
         return result, fail_reason
 
+    def _get_base_job_env(self):
+        """Process env (shell + app + CLI vars) shared by jobs without env_variables, built once per run."""
+        if self._base_job_env is None:
+            merged_env = interpolate_env_vars(
+                merge_env_vars(self.app_env_variables, self.cli_env_variables), self.logger
+            )
+            env = self.shell_env.copy()
+            env.update(merged_env)
+            self._base_job_env = env
+        return self._base_job_env
+
     def _run_dry(self, resume_run_id=None, resume_failed_only=False):
         """Execute a dry run showing the execution plan (delegated to JobScheduler)."""
         return self.execution_orchestrator.run_dry(resume_run_id, resume_failed_only)
 
     def _get_execution_order(self):
-        order = []
-        visited = set()
-        temp_visited = set()
-        def visit(node):
-            if node in temp_visited or node in visited:
-                return
-            temp_visited.add(node)
-            for dep in self.dependency_manager.get_job_dependencies(node):
-                if dep in self.jobs:
-                    visit(dep)
-            temp_visited.remove(node)
-            visited.add(node)
-            order.append(node)
-        for job_id in self.jobs:
-            if job_id not in visited:
-                visit(job_id)
-        return order
+        return self.dependency_manager.get_execution_order()
 
     def run(self, continue_on_error: bool = False, dry_run: bool = False, skip_jobs: list = None, max_iter: int = 1000, resume_run_id: int = None, resume_failed_only: bool = False):
+        if dry_run:
+            # A dry run only reads history: no schema fix-ups, retry writer or PRAGMA optimize
+            return self._run(continue_on_error, dry_run, skip_jobs, max_iter, resume_run_id, resume_failed_only)
+        # One SQLite connection serves every history/status write this thread makes during the run
+        with thread_connection(Config.DB_FILE):
+            # Schema fix-ups happen here once so the per-job write paths never run DDL
+            with db_connection(self.logger) as conn:
+                ExecutionHistoryManager.migrate_job_history(conn, self.logger)
+            if self.batch_history_writes:
+                self.job_history.start_retry_writer()
+            try:
+                return self._run(continue_on_error, dry_run, skip_jobs, max_iter, resume_run_id, resume_failed_only)
+            finally:
+                self.job_history.stop_retry_writer()
+
+    def _run(self, continue_on_error: bool, dry_run: bool, skip_jobs: list, max_iter: int, resume_run_id: int, resume_failed_only: bool):
         # Load dependency plugins at the start of run(), before printing execution banner
         if self.dependency_plugins:
             self.logger.info(f"Found {len(self.dependency_plugins)} dependency plugins to load")
             self.dependency_manager.load_dependency_plugins()
         
+        self._base_job_env = None
+        self._runner_kwargs = None
         # Initialize run (with resume_run_id if resuming)
         self.run_id = self.state_manager.initialize_run(resume_run_id)
+        self._set_job_log_naming()
         
         # Now set up the proper logger with run_id
         self.logger = setup_logging(self.application_name, self.run_id)
@@ -392,7 +409,7 @@ class JobExecutioner:
         # Set initial state through state manager
         self.state_manager.start_execution(continue_on_error, dry_run, self.working_dir)
         self.skip_jobs = set(skip_jobs or [])
-        divider = f"{Config.COLOR_CYAN}{'='*90}{Config.COLOR_RESET}"
+        divider = _BANNER_DIVIDER
         dry_run_text = " [DRY RUN]" if dry_run else ""
         parallel_text = f" [PARALLEL: {self.max_workers} workers]" if self.parallel else " [SEQUENTIAL]"
         if dry_run:
@@ -463,7 +480,7 @@ class JobExecutioner:
         # Finish execution through state manager
         if not self.dry_run:
             self.state_manager.finish_execution(self.completed_jobs, self.failed_jobs, self.skip_jobs)
-            if self._has_valid_email():
+            if self._email_valid:
                 if len(self.failed_jobs) > 0 and self.email_on_failure:
                     self._send_notification(success=False)
                 elif len(self.failed_jobs) == 0 and self.email_on_success:
@@ -481,7 +498,7 @@ class JobExecutioner:
         duration_str = timing_info["duration_string"]
         end_date = timing_info["end_time_str"]
         status = self.state_manager.get_run_status()
-        start_time_str = self.start_time.strftime('%Y-%m-%d %H:%M:%S')
+        start_time_str = timing_info["start_time_str"]
 
         # Print main summary
         self.summary_reporter.print_execution_summary(
@@ -520,7 +537,9 @@ class JobExecutioner:
         )
 
         # Print resume instructions or run info
-        failed_job_order = [j["id"] for j in self.config["jobs"] if j["id"] in self.failed_jobs]
+        # self.jobs keeps config order, so this matches the order of the failed-jobs list
+        failed_jobs = self.failed_jobs
+        failed_job_order = [job_id for job_id in self.jobs if job_id in failed_jobs]
         self.summary_reporter.print_resume_instructions(
             run_id=self.run_id,
             exit_code=self.exit_code,
@@ -533,29 +552,28 @@ class JobExecutioner:
         self.summary_reporter.print_final_divider()
 
     def _print_abort_summary(self, status, reason=None, missing_deps=None):
-        divider = f"{Config.COLOR_CYAN}{'='*40}{Config.COLOR_RESET}"
-        print(f"{divider}")
-        print(f"{Config.COLOR_CYAN}{'EXECUTION SUMMARY':^40}{Config.COLOR_RESET}")
-        print(f"{divider}")
-        print(f"{Config.COLOR_CYAN}Application:{Config.COLOR_RESET} {self.application_name}")
-        print(f"{Config.COLOR_CYAN}Run ID:{Config.COLOR_RESET} {self.run_id}")
-        print(f"{Config.COLOR_CYAN}Status:{Config.COLOR_RESET} {Config.COLOR_RED}{status}{Config.COLOR_RESET}")
+        cyan, red, reset = Config.COLOR_CYAN, Config.COLOR_RED, Config.COLOR_RESET
         start_time_str = self.start_time.strftime('%Y-%m-%d %H:%M:%S') if self.start_time else "N/A"
         end_time_str = self.end_time.strftime('%Y-%m-%d %H:%M:%S') if self.end_time else "N/A"
-        print(f"{Config.COLOR_CYAN}Start Time:{Config.COLOR_RESET} {start_time_str}")
-        print(f"{Config.COLOR_CYAN}End Time:{Config.COLOR_RESET} {end_time_str}")
-        print(f"{Config.COLOR_CYAN}Duration:{Config.COLOR_RESET} 0:00:00")
-        print(f"{Config.COLOR_CYAN}Jobs Completed:{Config.COLOR_RESET} 0")
-        print(f"{Config.COLOR_CYAN}Jobs Failed:{Config.COLOR_RESET} 0")
-        print(f"{Config.COLOR_CYAN}Jobs Skipped:{Config.COLOR_RESET} 0")
+        lines = [
+            SUMMARY_HEADER,
+            f"{cyan}Application:{reset} {self.application_name}",
+            f"{cyan}Run ID:{reset} {self.run_id}",
+            f"{cyan}Status:{reset} {red}{status}{reset}",
+            f"{cyan}Start Time:{reset} {start_time_str}",
+            f"{cyan}End Time:{reset} {end_time_str}",
+            f"{cyan}Duration:{reset} 0:00:00",
+            f"{cyan}Jobs Completed:{reset} 0",
+            f"{cyan}Jobs Failed:{reset} 0",
+            f"{cyan}Jobs Skipped:{reset} 0",
+        ]
         if reason:
-            print(f"\n{Config.COLOR_RED}Execution aborted: {reason}{Config.COLOR_RESET}")
+            lines.append(f"\n{red}Execution aborted: {reason}{reset}")
         if missing_deps:
-            print(f"\n{Config.COLOR_CYAN}Missing Dependencies:{Config.COLOR_RESET}")
-            for job_id, deps in missing_deps.items():
-                print(f"  - {Config.COLOR_RED}{job_id}{Config.COLOR_RESET}: {', '.join(deps)}")
-        print(f"{divider}")
-        print("\n")
+            lines.append(f"\n{cyan}Missing Dependencies:{reset}")
+            lines.extend(f"  - {red}{job_id}{reset}: {', '.join(deps)}" for job_id, deps in missing_deps.items())
+        lines.extend((SUMMARY_DIVIDER, "\n"))
+        print("\n".join(lines))
 
     def _run_sequential(self, max_iter: int) -> int:
         """Execute jobs sequentially with dependency resolution (delegated to JobScheduler)."""
@@ -582,7 +600,8 @@ class JobExecutioner:
             jobs_config=self.jobs,
             dependency_manager=self.dependency_manager,
             job_log_paths=self.job_log_paths,
-            failed_job_reasons=self.failed_job_reasons
+            failed_job_reasons=self.failed_job_reasons,
+            timing_info=self.state_manager.get_timing_info()
         )
         attachments = self.notification_manager.collect_log_attachments(self.run_id)
         self.notification_manager.send_notification(
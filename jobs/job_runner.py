@@ -1,10 +1,11 @@
 import os
 import time
+import signal
 import datetime
 import random
+import locale
+import threading
 import subprocess
-from queue import Queue, Empty
-from typing import Dict, Any, Tuple
 from jobs.checks import CHECK_REGISTRY
 from jobs.check_runner import run_checks
 from jobs.job_status_mixin import JobStatusMixin
@@ -15,13 +16,22 @@ EXIT_CODE_SUCCESS = 0
 EXIT_CODE_TIMEOUT = -1  # Process timed out and was killed
 EXIT_CODE_EXCEPTION = -2  # Exception occurred during execution
 
+_POSIX = os.name == 'posix'
+# Job output is read as raw bytes and decoded per line with the encoding text mode would use
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+# Seconds to keep reading after the job exits, for output a background child still holds open
+_OUTPUT_DRAIN_TIMEOUT = 5
+
 class JobRunner(JobStatusMixin):
-    def __init__(self, job_id: str, job_config: dict, global_env: dict, main_logger, config: dict, run_id: int, app_name: str, db_connection, update_job_status, update_retry_history, get_last_exit_code, setup_job_logger, cli_env=None, shell_env=None):
+    def __init__(self, job_id: str, job_config: dict, global_env: dict, main_logger, config: dict, run_id: int, app_name: str, db_connection, update_job_status, update_retry_history, get_last_exit_code, setup_job_logger, cli_env=None, shell_env=None, base_env=None):
         self.job_id = job_id
         self.job = job_config
         self.global_env = global_env
         self.cli_env = cli_env or {}
         self.shell_env = shell_env if shell_env is not None else dict(os.environ)  # Default to full environ for backward compatibility
+        # Prebuilt process env shared by jobs without their own env_variables
+        self.base_env = base_env
+        self._env = None  # Built on first attempt, reused by retries
         self.main_logger = main_logger  # Main logger for user-facing output
         self.config = config
         self.run_id = run_id
@@ -32,26 +42,27 @@ class JobRunner(JobStatusMixin):
         self.get_last_exit_code = get_last_exit_code
         self.setup_job_logger = setup_job_logger
 
-    def run(self, dry_run=False, continue_on_error=False, return_reason=False):
-        command = self.job["command"]
-        # Determine timeout: job['timeout'] > config['default_timeout'] > 10800
-        timeout = self.job.get("timeout")
+    @staticmethod
+    def _resolve_timeout(job_timeout, default_timeout):
+        """Determine timeout: job['timeout'] > config['default_timeout'] > 10800."""
+        timeout = job_timeout
         timeout_source = None
         if timeout is not None:
             timeout_source = f"timeout={timeout}"
         else:
-            timeout = self.config.get("default_timeout")
+            timeout = default_timeout
             if timeout is not None:
                 timeout_source = f"default timeout={timeout}"
         if timeout is None:
-            timeout = 10800
-            timeout_source = "default timeout=10800"
-        else:
-            try:
-                timeout = int(timeout)
-            except Exception:
-                timeout = 10800
-                timeout_source = "default timeout=10800"
+            return 10800, "default timeout=10800"
+        try:
+            return int(timeout), timeout_source
+        except Exception:
+            return 10800, "default timeout=10800"
+
+    def run(self, dry_run=False, continue_on_error=False, return_reason=False):
+        command = self.job["command"]
+        timeout, timeout_source = self._resolve_timeout(self.job.get("timeout"), self.config.get("default_timeout"))
         max_retries = self.job.get("max_retries", self.config.get("default_max_retries", 0))
         retry_delay = self.job.get("retry_delay", self.config.get("default_retry_delay", 30))
         retry_backoff = self.job.get("retry_backoff", self.config.get("default_retry_backoff", 1.5))
@@ -165,12 +176,12 @@ class JobRunner(JobStatusMixin):
                     # Check if status allows retry
                     if status in retry_on_status:
                         should_retry = True
-                        self.main_logger.debug(f"Job {self.job_id} status '{status}' is in retry_on_status list")
+                        self.main_logger.debug("Job %s status '%s' is in retry_on_status list", self.job_id, status)
 
                     # Check if exit code allows retry
                     if exit_code is not None and exit_code in retry_on_exit_codes:
                         should_retry = True
-                        self.main_logger.debug(f"Job {self.job_id} exit code {exit_code} is in retry_on_exit_codes list")
+                        self.main_logger.debug("Job %s exit code %s is in retry_on_exit_codes list", self.job_id, exit_code)
 
                     if should_retry:
                         # Calculate retry delay
@@ -217,7 +228,7 @@ class JobRunner(JobStatusMixin):
                         retry_history[-1]['status'] if retry_history else 'UNKNOWN',
                         fail_reason
                     )
-                    self.main_logger.debug(f"Saved retry history for {self.job_id}: {len(retry_history)} attempts")
+                    self.main_logger.debug("Saved retry history for %s: %d attempts", self.job_id, len(retry_history))
                 except Exception as e:
                     if hasattr(self, 'main_logger'):
                         self.main_logger.error(f"Error saving retry history: {e}")
@@ -235,36 +246,62 @@ class JobRunner(JobStatusMixin):
                 if hasattr(self, 'main_logger'):
                     self.main_logger.debug(f"Error closing file handler: {e}")
 
-    def _run_command(self, command, timeout, job_logger, start_time_dt=None):
-        import threading
+    def _build_env(self, job_logger):
+        job_env = self.job.get("env_variables")
+        if not job_env and self.base_env is not None:
+            return self.base_env
         # Merge environment variables: app -> job -> CLI (CLI has highest precedence)
-        merged_env = merge_env_vars(self.global_env, self.job.get("env_variables", {}))
+        merged_env = merge_env_vars(self.global_env, job_env)
         merged_env = merge_env_vars(merged_env, self.cli_env)
         # Interpolate variables after merging so job vars can reference app/CLI vars
         merged_env = interpolate_env_vars(merged_env, job_logger)
         # Start with filtered shell environment instead of full os.environ
         env = self.shell_env.copy()
         env.update(merged_env)
+        return env
+
+    def _run_command(self, command, timeout, job_logger, start_time_dt=None):
+        if self._env is None:
+            self._env = self._build_env(job_logger)
+        env = self._env
         process = subprocess.Popen(
             command,
             shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1,
+            bufsize=0,
             env=env,
-            preexec_fn=os.setsid if 'posix' in os.name else None
+            start_new_session=_POSIX  # setsid() in the child without a Python preexec_fn
         )
         self.last_exit_code = None  # Track exit code
+        # Set once the reader should give up before EOF: on timeout, or when the
+        # post-exit drain runs out of time
         stop_reading = threading.Event()
         def read_output():
+            # Large raw reads instead of line-by-line text iteration; only whole lines are logged
+            # bufsize=0 makes stdout a raw FileIO, so read() is a single read(2) call
+            stdout = process.stdout
+            pending = b""
             try:
-                for line in process.stdout:
+                while True:
+                    chunk = stdout.read(65536)
+                    if not chunk:
+                        # EOF: whatever is left is the final, unterminated line
+                        if pending:
+                            job_logger.info(pending.rstrip().decode(_OUTPUT_ENCODING, errors="replace"))
+                        break
+                    # \n, \r\n and a lone \r all end a line, as in text mode. A line ending
+                    # in \r stays pending in case the next read starts with its \n
+                    lines = (pending + chunk).splitlines(True)
+                    pending = lines.pop() if not lines[-1].endswith(b"\n") else b""
+                    for line in lines:
+                        job_logger.info(line.rstrip().decode(_OUTPUT_ENCODING, errors="replace"))
                     if stop_reading.is_set():
                         break
-                    job_logger.info(line.rstrip())
             except Exception as e:
-                job_logger.error(f"Error reading process output: {e}")
+                # Once told to stop, the pipe may already have been closed under us
+                if not stop_reading.is_set():
+                    job_logger.error(f"Error reading process output: {e}")
         reader_thread = threading.Thread(target=read_output, daemon=True)
         reader_thread.start()
         try:
@@ -277,8 +314,7 @@ class JobRunner(JobStatusMixin):
                 job_logger.error(msg)
                 self.main_logger.error(msg)
                 try:
-                    if 'posix' in os.name:
-                        import signal
+                    if _POSIX:
                         os.killpg(os.getpgid(process.pid), signal.SIGTERM)
                         time.sleep(1)
                         if process.poll() is None:
@@ -303,8 +339,12 @@ class JobRunner(JobStatusMixin):
                 else:
                     self.mark_failed(self.job_id, "TIMEOUT")
                 return "TIMEOUT"
-            stop_reading.set()
-            reader_thread.join(timeout=5)
+            # Let the reader drain the pipe to EOF, but not past a fixed deadline: a
+            # background child may have inherited the pipe and keep it open
+            reader_thread.join(timeout=_OUTPUT_DRAIN_TIMEOUT)
+            if reader_thread.is_alive():
+                stop_reading.set()
+                reader_thread.join(timeout=1)
             if reader_thread.is_alive():
                 job_logger.warning("Output reading thread did not terminate cleanly after process exit")
             self.last_exit_code = exit_code
@@ -1,10 +1,17 @@
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
 def to_json(data, pretty=False):
     try:
         if pretty:
             return json.dumps(data, indent=2, sort_keys=True)
-        return json.dumps(data)
+        if orjson is not None:
+            return orjson.dumps(data).decode()
+        return json.dumps(data, separators=(',', ':'))
     except (TypeError, ValueError) as e:
         raise RuntimeError(f"JSON serialization error: {e}")
 
@@ -12,4 +19,13 @@ def from_json(json_str):
     try:
         return json.loads(json_str)
     except (TypeError, ValueError) as e:
-        raise RuntimeError(f"JSON deserialization error: {e}") 
\ No newline at end of file
+        raise RuntimeError(f"JSON deserialization error: {e}")
+
+
+def load_json_file(path):
+    """Parse a JSON file; invalid JSON raises json.JSONDecodeError either way."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
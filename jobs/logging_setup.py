@@ -4,6 +4,47 @@ import os
 from logging.handlers import RotatingFileHandler
 from config.loader import Config
 
+
+class ColorFormatter(logging.Formatter):
+    RED = '\033[31m'
+    RESET = '\033[0m'
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+    def format(self, record):
+        levelname = record.levelname
+        if levelname == 'ERROR':
+            record.levelname = f"{self.RED}{levelname}{self.RESET}"
+        result = super().format(record)
+        record.levelname = levelname  # Restore for other handlers
+        return result
+
+
+# Formatters hold no per-handler state, so every handler shares these
+_DETAILED_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+_SUMMARY_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - [RUN #%(run_id)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+_COLOR_FORMATTER = ColorFormatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+_JOB_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+# run_id/application_name stamped on every record; the factory is installed
+# once and setup_logging only updates this, instead of nesting a new factory per call
+_record_context = {"run_id": None, "application_name": None}
+_factory_installed = False
+
+
+def _install_record_factory():
+    global _factory_installed
+    if _factory_installed:
+        return
+    old_factory = logging.getLogRecordFactory()
+    def record_factory(*args, **kwargs):
+        record = old_factory(*args, **kwargs)
+        record.run_id = _record_context["run_id"]
+        record.application_name = _record_context["application_name"]
+        return record
+    logging.setLogRecordFactory(record_factory)
+    _factory_installed = True
+
+
 def setup_logging(application_name, run_id):
     """
     Set up and return a logger for the executioner application.
@@ -18,33 +59,13 @@ def setup_logging(application_name, run_id):
     file_handler = logging.FileHandler(master_log_path)
     app_file_handler = RotatingFileHandler(app_log_path, maxBytes=Config.MAX_LOG_SIZE, backupCount=Config.BACKUP_LOG_COUNT)
     console_handler = logging.StreamHandler(sys.stdout)
-    detailed_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    summary_formatter = logging.Formatter('%(asctime)s - %(levelname)s - [RUN #%(run_id)s] %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    file_handler.setFormatter(detailed_formatter)
-    app_file_handler.setFormatter(summary_formatter)
+    file_handler.setFormatter(_DETAILED_FORMATTER)
+    app_file_handler.setFormatter(_SUMMARY_FORMATTER)
+    console_handler.setFormatter(_COLOR_FORMATTER)
 
-    class ColorFormatter(logging.Formatter):
-        RED = '\033[31m'
-        RESET = '\033[0m'
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-        def format(self, record):
-            levelname = record.levelname
-            if levelname == 'ERROR':
-                record.levelname = f"{self.RED}{levelname}{self.RESET}"
-            result = super().format(record)
-            record.levelname = levelname  # Restore for other handlers
-            return result
-    color_formatter = ColorFormatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    console_handler.setFormatter(color_formatter)
-
-    old_factory = logging.getLogRecordFactory()
-    def record_factory(*args, **kwargs):
-        record = old_factory(*args, **kwargs)
-        record.run_id = run_id
-        record.application_name = application_name
-        return record
-    logging.setLogRecordFactory(record_factory)
+    _record_context["run_id"] = run_id
+    _record_context["application_name"] = application_name
+    _install_record_factory()
 
     logger.addHandler(file_handler)
     logger.addHandler(app_file_handler)
@@ -61,8 +82,9 @@ def setup_job_logger(application_name, run_id, job_id, job_log_path):
     job_logger.propagate = False
     for handler in job_logger.handlers[:]:
         job_logger.removeHandler(handler)
-    job_file_handler = logging.FileHandler(job_log_path)
-    job_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    # delay=True: the log file is only created once the job writes to it
+    job_file_handler = logging.FileHandler(job_log_path, delay=True)
+    job_file_handler.setFormatter(_JOB_FORMATTER)
     job_logger.addHandler(job_file_handler)
     job_logger.setLevel(logging.DEBUG)
-    return job_logger, job_file_handler 
\ No newline at end of file
+    return job_logger, job_file_handler
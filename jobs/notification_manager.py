@@ -1,10 +1,5 @@
-import smtplib
-import ssl
-import glob
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.base import MIMEBase
-from email import encoders
+# smtplib and the email package are imported where they are used: most runs
+# never send mail, and together they are a large share of startup import time
 from jobs.logging_setup import setup_logging
 import os
 
@@ -37,6 +32,11 @@ class NotificationManager:
             return
         if (success and not self.email_on_success) or (not success and not self.email_on_failure):
             return
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.base import MIMEBase
+        from email import encoders
         subject_status = "SUCCESS" if success else "FAILURE"
         subject = f"[{self.application_name}] Run #{run_id} {subject_status}"
         if subject_extra:
@@ -62,10 +62,9 @@ class NotificationManager:
                 except Exception as e:
                     self.logger.error(f"Failed to attach file {file_path}: {e}")
         try:
-            context = ssl.create_default_context()
             with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
                 server.ehlo()
-                #server.starttls(context=context)
+                #server.starttls(context=ssl.create_default_context())
                 if self.smtp_user and self.smtp_password:
                     server.login(self.smtp_user, self.smtp_password)
                 server.sendmail(message["From"], recipients, message.as_string())
@@ -74,78 +73,94 @@ class NotificationManager:
             self.logger.error(f"Failed to send notification email: {e}")
 
     def generate_execution_summary(self, success, run_id, start_time, end_time, completed_jobs, failed_jobs, skip_jobs, 
-                                  jobs_config, dependency_manager, job_log_paths, failed_job_reasons):
-        """Generate a comprehensive execution summary for notifications."""
+                                  jobs_config, dependency_manager, job_log_paths, failed_job_reasons, timing_info=None):
+        """Generate a comprehensive execution summary for notifications.
+
+        timing_info, when given, is StateManager.get_timing_info() and supplies the
+        already formatted start/end/duration strings.
+        """
         # Calculate skipped jobs due to dependencies
         skipped_due_to_deps = []
+        satisfied = completed_jobs | skip_jobs
+        dependencies = dependency_manager.dependencies
         for job_id in jobs_config:
-            if job_id not in completed_jobs and job_id not in failed_jobs and job_id not in skip_jobs:
-                unmet = [dep for dep in dependency_manager.get_job_dependencies(job_id) 
-                        if dep not in completed_jobs and dep not in skip_jobs]
+            if job_id not in satisfied and job_id not in failed_jobs:
+                unmet = sorted(dependencies.get(job_id, frozenset()) - satisfied)
                 failed_unmet = [dep for dep in unmet if dep in failed_jobs]
                 skipped_due_to_deps.append((job_id, unmet, failed_unmet))
         
         # Basic summary information
         status = "SUCCESS" if success else "FAILED"
-        duration = end_time - start_time if end_time and start_time else None
-        duration_str = str(duration).split('.')[0] if duration else "N/A"
+        if timing_info is not None:
+            duration_str = timing_info["duration_string"]
+            start_str = timing_info["start_time_str"]
+            end_str = timing_info["end_time_str"]
+        else:
+            duration = end_time - start_time if end_time and start_time else None
+            duration_str = str(duration).split('.')[0] if duration else "N/A"
+            start_str = start_time.strftime('%Y-%m-%d %H:%M:%S') if start_time else 'N/A'
+            end_str = end_time.strftime('%Y-%m-%d %H:%M:%S') if end_time else 'N/A'
         
-        summary = (
-            f"Application: {self.application_name}\n"
-            f"Run ID: {run_id}\n"
-            f"Status: {status}\n"
-            f"Start Time: {start_time.strftime('%Y-%m-%d %H:%M:%S') if start_time else 'N/A'}\n"
-            f"End Time: {end_time.strftime('%Y-%m-%d %H:%M:%S') if end_time else 'N/A'}\n"
-            f"Duration: {duration_str}\n"
-            f"Jobs Completed: {len(completed_jobs)}\n"
-            f"Jobs Failed: {len(failed_jobs)}\n"
-            f"Jobs Skipped: {len(skip_jobs) + len(skipped_due_to_deps)}\n"
-        )
+        lines = [
+            f"Application: {self.application_name}",
+            f"Run ID: {run_id}",
+            f"Status: {status}",
+            f"Start Time: {start_str}",
+            f"End Time: {end_str}",
+            f"Duration: {duration_str}",
+            f"Jobs Completed: {len(completed_jobs)}",
+            f"Jobs Failed: {len(failed_jobs)}",
+            f"Jobs Skipped: {len(skip_jobs) + len(skipped_due_to_deps)}",
+        ]
         
         # Add failed jobs details - handle both dict and list formats
         if isinstance(jobs_config, dict):
             # jobs_config is a dict like {job_id: job_config}
             failed_job_order = [job_id for job_id in failed_jobs if job_id in jobs_config]
+            descriptions = {job_id: job.get('description', '') for job_id, job in jobs_config.items()}
         else:
             # jobs_config is a list like [{"id": job_id, ...}, ...]
             failed_job_order = [j["id"] for j in jobs_config if j["id"] in failed_jobs]
+            descriptions = {}
+            for j in jobs_config:
+                descriptions.setdefault(j.get('id'), j.get('description', ''))
             
         if failed_job_order:
-            summary += "\nFailed Jobs:\n"
+            lines.append("")
+            lines.append("Failed Jobs:")
             for job_id in failed_job_order:
                 job_log_path = job_log_paths.get(job_id, None)
-                if isinstance(jobs_config, dict):
-                    desc = jobs_config[job_id].get('description', '')
-                else:
-                    desc = next((j.get('description', '') for j in jobs_config if j.get('id') == job_id), '')
-                reason = failed_job_reasons.get(job_id, '')
-                summary += f"  - {job_id}: {desc}\n      Reason: {reason}"
+                lines.append(f"  - {job_id}: {descriptions.get(job_id, '')}")
+                lines.append(f"      Reason: {failed_job_reasons.get(job_id, '')}")
                 if job_log_path:
-                    summary += f"\n      Log: {job_log_path}"
-                summary += "\n"
+                    lines.append(f"      Log: {job_log_path}")
         
         # Add skipped jobs details
         if skipped_due_to_deps:
-            summary += "\nSkipped Jobs (unmet dependencies):\n"
+            lines.append("")
+            lines.append("Skipped Jobs (unmet dependencies):")
             for job_id, unmet, failed_unmet in skipped_due_to_deps:
-                if isinstance(jobs_config, dict):
-                    desc = jobs_config.get(job_id, {}).get('description', '')
-                else:
-                    desc = next((j.get('description', '') for j in jobs_config if j.get('id') == job_id), '')
+                lines.append(f"  - {job_id}: {descriptions.get(job_id, '')}")
                 if failed_unmet:
-                    summary += f"  - {job_id}: {desc}\n      Skipped (failed dependencies: {', '.join(failed_unmet)}; other unmet: {', '.join([d for d in unmet if d not in failed_unmet])})\n"
+                    lines.append(f"      Skipped (failed dependencies: {', '.join(failed_unmet)}; other unmet: {', '.join([d for d in unmet if d not in failed_unmet])})")
                 else:
-                    summary += f"  - {job_id}: {desc}\n      Skipped (unmet dependencies: {', '.join(unmet)})\n"
+                    lines.append(f"      Skipped (unmet dependencies: {', '.join(unmet)})")
         
-        return summary
+        return "\n".join(lines) + "\n"
 
     def collect_log_attachments(self, run_id):
         """Collect all log files for a specific run."""
         from config.loader import Config
         
-        # Collect all job log files for this run
-        log_pattern = os.path.join(Config.LOG_DIR, f"executioner.{self.application_name}.job-*.run-{run_id}.log")
-        attachments = glob.glob(log_pattern)
+        # Collect all job log files for this run (executioner.<app>.job-*.run-<id>.log)
+        prefix = f"executioner.{self.application_name}.job-"
+        suffix = f".run-{run_id}.log"
+        try:
+            with os.scandir(Config.LOG_DIR) as entries:
+                attachments = [entry.path for entry in entries
+                               if entry.name.startswith(prefix) and entry.name.endswith(suffix)]
+        except FileNotFoundError:
+            attachments = []
         
         # Add main application-level run log
         main_log_path = os.path.join(Config.LOG_DIR, f"executioner.{self.application_name}.run-{run_id}.log")
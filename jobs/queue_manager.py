@@ -10,9 +10,8 @@ This module provides the QueueManager class that handles:
 
 import threading
 import logging
-from queue import Queue, Empty
-from typing import Dict, Set, List, Optional
-from concurrent.futures import Future
+from collections import deque
+from typing import Deque, Dict, Iterable, Set, Optional
 
 from jobs.dependency_manager import DependencyManager
 
@@ -36,21 +35,21 @@ class QueueManager:
         self.dependency_manager = dependency_manager
         self.logger = logger
         
-        # Threading primitives
-        self.lock = threading.RLock()
-        self.job_completed_condition = threading.Condition()
+        # No method calls another locking method while holding the lock, so it
+        # need not be reentrant
+        self.lock = threading.Lock()
         
-        # Job queue and state tracking
-        self.job_queue: Queue = Queue()
+        # Job queue and state tracking. Only the dispatching thread touches the
+        # queue, and every mutation happens under self.lock, so a deque suffices.
+        self.job_queue: Deque[str] = deque()
         self.completed_jobs: Set[str] = set()
         self.failed_jobs: Set[str] = set()
         self.failed_job_reasons: Dict[str, str] = {}
         self.queued_jobs: Set[str] = set()
         self.active_jobs: Set[str] = set()
         self.skip_jobs: Set[str] = set()
-        
-        # Future tracking for parallel execution
-        self.future_to_job_id: Dict[Future, str] = {}
+        # Unsatisfied dependency count per job, seeded by queue_initial_jobs()
+        self._remaining_deps: Dict[str, int] = {}
     
     def set_skip_jobs(self, skip_jobs: Set[str]) -> None:
         """Set the jobs that should be skipped."""
@@ -81,35 +80,29 @@ class QueueManager:
         """Add a job to the queue."""
         with self.lock:
             if job_id not in self.queued_jobs:
-                self.job_queue.put(job_id)
+                self.job_queue.append(job_id)
                 self.queued_jobs.add(job_id)
-                self.logger.debug(f"Queued job: {job_id}")
+                self.logger.debug("Queued job: %s", job_id)
     
-    def get_next_job(self, timeout: Optional[float] = None) -> Optional[str]:
+    def get_next_job(self) -> Optional[str]:
         """
         Get the next job from the queue.
         
-        Args:
-            timeout: Optional timeout for queue get operation
-            
         Returns:
-            Job ID if available, None if queue is empty or timeout
+            Job ID if available, None if queue is empty
         """
         try:
-            if timeout is not None:
-                return self.job_queue.get(timeout=timeout)
-            else:
-                return self.job_queue.get_nowait()
-        except Empty:
+            return self.job_queue.popleft()
+        except IndexError:
             return None
     
     def is_queue_empty(self) -> bool:
         """Check if the job queue is empty."""
-        return self.job_queue.empty()
+        return not self.job_queue
     
     def get_queue_size(self) -> int:
         """Get the current size of the job queue."""
-        return self.job_queue.qsize()
+        return len(self.job_queue)
     
     def is_job_ready(self, job_id: str) -> bool:
         """
@@ -128,7 +121,7 @@ class QueueManager:
                 job_id in self.failed_jobs):
                 return False
             
-            deps = self.dependency_manager.get_job_dependencies(job_id)
+            deps = self.dependency_manager.dependencies.get(job_id, ())
             missing_deps = [dep for dep in deps 
                           if dep not in self.completed_jobs and dep not in self.skip_jobs]
             return len(missing_deps) == 0
@@ -136,14 +129,19 @@ class QueueManager:
     def queue_initial_jobs(self) -> None:
         """Queue all jobs that have no unsatisfied dependencies."""
         with self.lock:
-            for job_id, deps in self.dependency_manager.get_all_dependencies().items():
+            ready = []
+            satisfied = self.completed_jobs | self.skip_jobs
+            for job_id, deps in self.dependency_manager.dependencies.items():
+                remaining = len(deps - satisfied)
+                self._remaining_deps[job_id] = remaining
                 if job_id in self.skip_jobs:
                     continue
-                all_deps_satisfied = all(dep in self.completed_jobs or dep in self.skip_jobs 
-                                       for dep in deps)
-                if all_deps_satisfied and job_id not in self.queued_jobs:
-                    self.queue_job(job_id)
-                    self.logger.debug(f"Initially queuing job: {job_id}")
+                if remaining == 0 and job_id not in self.queued_jobs:
+                    ready.append(job_id)
+            
+            self.queued_jobs.update(ready)
+            self.job_queue.extend(ready)
+            self.logger.debug("Initially queued jobs: %s", ready)
     
     def queue_dependent_jobs(self, completed_job_id: str, dry_run: bool = False) -> None:
         """
@@ -153,74 +151,45 @@ class QueueManager:
             completed_job_id: ID of the job that just completed
             dry_run: If True, skip actual queuing (for dry run mode)
         """
+        self.queue_dependents_batch((completed_job_id,), dry_run)
+    
+    def queue_dependents_batch(self, completed_job_ids: Iterable[str], dry_run: bool = False) -> None:
+        """
+        Queue jobs that depend on any of the completed jobs, under one lock acquisition.
+        
+        Args:
+            completed_job_ids: IDs of the jobs that just completed
+            dry_run: If True, skip actual queuing (for dry run mode)
+        """
         if dry_run:
             return
             
         with self.lock:
-            self.logger.debug(f"Queueing jobs dependent on {completed_job_id}")
-            
-            # Take snapshots to avoid state changes during iteration
-            completed_jobs_snapshot = self.completed_jobs.copy()
-            failed_jobs_snapshot = self.failed_jobs.copy()
-            skip_jobs_snapshot = self.skip_jobs.copy()
-            active_jobs_snapshot = self.active_jobs.copy()
-            queued_jobs_snapshot = self.queued_jobs.copy()
+            self.logger.debug("Queueing jobs dependent on %s", completed_job_ids)
             
-            jobs_to_queue = []
+            ready = []
+            for completed_job_id in completed_job_ids:
+                for job_id in self.dependency_manager.get_dependents(completed_job_id):
+                    if job_id not in self._remaining_deps:
+                        continue
+                    self._remaining_deps[job_id] -= 1
+                    if self._remaining_deps[job_id] > 0:
+                        continue
+                    
+                    # Skip if job is already processed or in progress
+                    if (job_id in self.completed_jobs or
+                        job_id in self.queued_jobs or
+                        job_id in self.active_jobs or
+                        job_id in self.skip_jobs or
+                        job_id in self.failed_jobs):
+                        continue
+                    
+                    ready.append(job_id)
             
-            for job_id, deps in self.dependency_manager.get_all_dependencies().items():
-                # Skip if completed job is not a dependency
-                if completed_job_id not in deps:
-                    continue
-                
-                # Skip if job is already processed or in progress
-                if (job_id in completed_jobs_snapshot or
-                    job_id in queued_jobs_snapshot or
-                    job_id in active_jobs_snapshot or
-                    job_id in skip_jobs_snapshot or
-                    job_id in failed_jobs_snapshot):
-                    continue
-                
-                # Check if all dependencies are satisfied
-                all_deps_satisfied = True
-                has_failed_deps = False
-                
-                for dep in deps:
-                    if dep in failed_jobs_snapshot:
-                        has_failed_deps = True
-                        self.logger.debug(f"Job {job_id} has failed dependency: {dep}")
-                        break
-                    if dep not in completed_jobs_snapshot and dep not in skip_jobs_snapshot:
-                        all_deps_satisfied = False
-                        break
-                
-                # Skip jobs with failed dependencies
-                if has_failed_deps:
-                    continue
-                
-                # Queue job if all dependencies are satisfied
-                if all_deps_satisfied:
-                    jobs_to_queue.append(job_id)
-                    self.queued_jobs.add(job_id)
-            
-            # Queue all eligible jobs
-            for job_id in jobs_to_queue:
-                self.job_queue.put(job_id)
-                self.logger.debug(f"Queued dependent job: {job_id}")
-            
-            # Notify waiting threads
-            with self.job_completed_condition:
-                self.job_completed_condition.notify_all()
-    
-    def register_future(self, future: Future, job_id: str) -> None:
-        """Register a future with its corresponding job ID."""
-        with self.lock:
-            self.future_to_job_id[future] = job_id
-    
-    def unregister_future(self, future: Future) -> Optional[str]:
-        """Unregister a future and return its job ID."""
-        with self.lock:
-            return self.future_to_job_id.pop(future, None)
+            if ready:
+                self.queued_jobs.update(ready)
+                self.job_queue.extend(ready)
+                self.logger.debug("Queued dependent jobs: %s", ready)
     
     def get_status_summary(self) -> Dict[str, int]:
         """
@@ -242,10 +211,3 @@ class QueueManager:
         """Get a copy of failed job reasons."""
         with self.lock:
             return self.failed_job_reasons.copy()
-    
-    def cleanup_future(self, future: Future) -> None:
-        """Clean up future tracking and job state."""
-        with self.lock:
-            job_id = self.future_to_job_id.pop(future, None)
-            if job_id:
-                self.active_jobs.discard(job_id)
\ No newline at end of file
@@ -11,9 +11,13 @@ This module provides the StateManager class that handles:
 
 import datetime
 import logging
+import time
 from typing import Dict, Optional, Any, Set
 from jobs.execution_history_manager import ExecutionHistoryManager
 
+# Job statuses a resume treats as failed (re-run them rather than skip)
+FAILED_STATUSES = frozenset(("FAILED", "ERROR", "TIMEOUT"))
+
 
 class StateManager:
     """
@@ -49,6 +53,11 @@ class StateManager:
         self.attempt_id: int = 1  # Default attempt_id for new runs
         self.start_time: Optional[datetime.datetime] = None
         self.end_time: Optional[datetime.datetime] = None
+        # Monotonic clock readings for duration math; start/end_time are for display
+        self._start_mono: Optional[float] = None
+        self._end_mono: Optional[float] = None
+        # get_timing_info() result, reused while start/end times are unchanged
+        self._timing_info: Optional[Dict[str, Any]] = None
         self.exit_code: int = 0
 
         # Execution control flags
@@ -97,6 +106,8 @@ class StateManager:
         self.continue_on_error = continue_on_error
         self.dry_run = dry_run
         self.start_time = datetime.datetime.now()
+        self._start_mono = time.monotonic()
+        self._end_mono = None
         self.exit_code = 0
         self.interrupted = False
 
@@ -126,14 +137,15 @@ class StateManager:
             skipped_jobs: Set of skipped job IDs
         """
         self.end_time = datetime.datetime.now()
+        self._end_mono = time.monotonic()
 
         # Determine final status
         status = "SUCCESS" if self.exit_code == 0 else "FAILED"
 
         # Check for incomplete jobs
-        all_job_ids = set(self.jobs.keys())
-        processed_jobs = completed_jobs | failed_jobs | skipped_jobs
-        not_completed = all_job_ids - processed_jobs
+        not_completed = [job_id for job_id in self.jobs
+                         if job_id not in completed_jobs and job_id not in failed_jobs
+                         and job_id not in skipped_jobs]
 
         if not_completed:
             self.logger.warning(f"The following jobs were not completed: {', '.join(not_completed)}")
@@ -197,10 +209,13 @@ class StateManager:
 
         return self.previous_job_statuses.copy()
 
-    def determine_jobs_to_skip(self) -> Set[str]:
+    def determine_jobs_to_skip(self, dry_run: bool = False) -> Set[str]:
         """
         Determine which jobs should be skipped based on resume settings.
 
+        Args:
+            dry_run: Log the decisions as "would skip/re-run" for an execution plan
+
         Returns:
             Set of job IDs that should be skipped
         """
@@ -216,14 +231,14 @@ class StateManager:
             if status == "SUCCESS":
                 # Always skip successful jobs
                 jobs_to_skip.add(job_id)
-                self.logger.info(f"Skipping previously successful job: {job_id}")
-            elif self.resume_failed_only and status in ["FAILED", "ERROR", "TIMEOUT"]:
+                self.logger.info(f"{'Would skip' if dry_run else 'Skipping'} previously successful job: {job_id}")
+            elif self.resume_failed_only and status in FAILED_STATUSES:
                 # In failed-only mode, re-run failed jobs
-                self.logger.info(f"Will re-run previously failed job: {job_id}")
-            elif not self.resume_failed_only and status not in ["FAILED", "ERROR", "TIMEOUT"]:
+                self.logger.info(f"{'Would' if dry_run else 'Will'} re-run previously failed job: {job_id}")
+            elif not self.resume_failed_only and status not in FAILED_STATUSES:
                 # In normal resume mode, skip non-failed jobs
                 jobs_to_skip.add(job_id)
-                self.logger.info(f"Skipping job with status {status}: {job_id}")
+                self.logger.info(f"{'Would skip' if dry_run else 'Skipping'} job with status {status}: {job_id}")
 
         return jobs_to_skip
 
@@ -245,6 +260,8 @@ class StateManager:
         Returns:
             Duration as timedelta if both start and end times are set, None otherwise
         """
+        if self._start_mono is not None and self._end_mono is not None:
+            return datetime.timedelta(seconds=self._end_mono - self._start_mono)
         if self.start_time and self.end_time:
             return self.end_time - self.start_time
         return None
@@ -303,14 +320,20 @@ class StateManager:
         Returns:
             Dictionary with timing information
         """
-        return {
+        cached = self._timing_info
+        if (cached is not None and cached["start_time"] is self.start_time
+                and cached["end_time"] is self.end_time):
+            return cached
+        duration = self.get_duration()
+        self._timing_info = {
             "start_time": self.start_time,
             "end_time": self.end_time,
-            "duration": self.get_duration(),
-            "duration_string": self.get_duration_string(),
+            "duration": duration,
+            "duration_string": str(duration).split('.')[0] if duration else "N/A",
             "start_time_str": self.start_time.strftime('%Y-%m-%d %H:%M:%S') if self.start_time else "N/A",
             "end_time_str": self.end_time.strftime('%Y-%m-%d %H:%M:%S') if self.end_time else "N/A"
         }
+        return self._timing_info
 
     def commit_job_statuses(self) -> None:
         """Commit any pending job status updates to persistence."""
@@ -11,6 +11,10 @@ This module provides the SummaryReporter class that handles:
 from typing import Dict, List, Set, Tuple
 from config.loader import Config
 
+# Built once; every summary block is framed by this line
+SUMMARY_DIVIDER = f"{Config.COLOR_CYAN}{'='*40}{Config.COLOR_RESET}"
+SUMMARY_HEADER = f"{SUMMARY_DIVIDER}\n{Config.COLOR_CYAN}{'EXECUTION SUMMARY':^40}{Config.COLOR_RESET}\n{SUMMARY_DIVIDER}"
+
 
 class SummaryReporter:
     """
@@ -45,24 +49,22 @@ class SummaryReporter:
         attempt_id: int = None
     ) -> None:
         """Print the main execution summary header."""
+        cyan, reset = Config.COLOR_CYAN, Config.COLOR_RESET
         status_color = Config.COLOR_DARK_GREEN if exit_code == 0 else Config.COLOR_RED
-        divider = f"{Config.COLOR_CYAN}{'='*40}{Config.COLOR_RESET}"
+        run_label = f"{run_id} (Attempt {attempt_id})" if attempt_id and attempt_id > 1 else run_id
         
-        print(f"{divider}")
-        print(f"{Config.COLOR_CYAN}{'EXECUTION SUMMARY':^40}{Config.COLOR_RESET}")
-        print(f"{divider}")
-        print(f"{Config.COLOR_CYAN}Application:{Config.COLOR_RESET} {self.application_name}")
-        if attempt_id and attempt_id > 1:
-            print(f"{Config.COLOR_CYAN}Run ID:{Config.COLOR_RESET} {Config.COLOR_YELLOW}{run_id} (Attempt {attempt_id}){Config.COLOR_RESET}")
-        else:
-            print(f"{Config.COLOR_CYAN}Run ID:{Config.COLOR_RESET} {Config.COLOR_YELLOW}{run_id}{Config.COLOR_RESET}")
-        print(f"{Config.COLOR_CYAN}Status:{Config.COLOR_RESET} {status_color}{status}{Config.COLOR_RESET}")
-        print(f"{Config.COLOR_CYAN}Start Time:{Config.COLOR_RESET} {start_time_str}")
-        print(f"{Config.COLOR_CYAN}End Time:{Config.COLOR_RESET} {end_time_str}")
-        print(f"{Config.COLOR_CYAN}Duration:{Config.COLOR_RESET} {duration_str}")
-        print(f"{Config.COLOR_CYAN}Jobs Completed:{Config.COLOR_RESET} {Config.COLOR_DARK_GREEN}{len(completed_jobs)}{Config.COLOR_RESET}")
-        print(f"{Config.COLOR_CYAN}Jobs Failed:{Config.COLOR_RESET} {Config.COLOR_RED if len(failed_jobs) > 0 else ''}{len(failed_jobs)}{Config.COLOR_RESET}")
-        print(f"{Config.COLOR_CYAN}Jobs Skipped:{Config.COLOR_RESET} {Config.COLOR_YELLOW if len(skip_jobs) > 0 else ''}{len(skip_jobs)}{Config.COLOR_RESET}")
+        print("\n".join((
+            SUMMARY_HEADER,
+            f"{cyan}Application:{reset} {self.application_name}",
+            f"{cyan}Run ID:{reset} {Config.COLOR_YELLOW}{run_label}{reset}",
+            f"{cyan}Status:{reset} {status_color}{status}{reset}",
+            f"{cyan}Start Time:{reset} {start_time_str}",
+            f"{cyan}End Time:{reset} {end_time_str}",
+            f"{cyan}Duration:{reset} {duration_str}",
+            f"{cyan}Jobs Completed:{reset} {Config.COLOR_DARK_GREEN}{len(completed_jobs)}{reset}",
+            f"{cyan}Jobs Failed:{reset} {Config.COLOR_RED if failed_jobs else ''}{len(failed_jobs)}{reset}",
+            f"{cyan}Jobs Skipped:{reset} {Config.COLOR_YELLOW if skip_jobs else ''}{len(skip_jobs)}{reset}",
+        )))
 
     def calculate_skipped_due_to_deps(
         self, 
@@ -74,10 +76,11 @@ class SummaryReporter:
     ) -> List[Tuple[str, List[str], List[str]]]:
         """Calculate jobs skipped due to unmet dependencies."""
         skipped_due_to_deps = []
+        satisfied = completed_jobs | skip_jobs
+        dependencies = dependency_manager.dependencies
         for job_id in jobs:
-            if job_id not in completed_jobs and job_id not in failed_jobs and job_id not in skip_jobs:
-                unmet = [dep for dep in dependency_manager.get_job_dependencies(job_id) 
-                        if dep not in completed_jobs and dep not in skip_jobs]
+            if job_id not in satisfied and job_id not in failed_jobs:
+                unmet = sorted(dependencies.get(job_id, frozenset()) - satisfied)
                 failed_unmet = [dep for dep in unmet if dep in failed_jobs]
                 skipped_due_to_deps.append((job_id, unmet, failed_unmet))
         return skipped_due_to_deps
@@ -90,18 +93,18 @@ class SummaryReporter:
         failed_job_reasons: Dict[str, str]
     ) -> None:
         """Print detailed summary of failed jobs."""
-        failed_job_order = [j["id"] for j in jobs_config if j["id"] in failed_jobs]
-        if not failed_job_order:
+        failed = [(j["id"], j.get('description', '')) for j in jobs_config if j["id"] in failed_jobs]
+        if not failed:
             return
             
-        print("\nFailed Jobs:")
-        for job_id in failed_job_order:
+        lines = ["\nFailed Jobs:"]
+        for job_id, description in failed:
             job_log_path = job_log_paths.get(job_id, None)
-            desc = next((j.get('description', '') for j in jobs_config if j.get('id') == job_id), '')
             reason = failed_job_reasons.get(job_id, '')
-            print(f"  - {job_id}: {desc}\n      Reason: {reason}")
+            lines.append(f"  - {job_id}: {description}\n      Reason: {reason}")
             if job_log_path:
-                print(f"      Log: {job_log_path}")
+                lines.append(f"      Log: {job_log_path}")
+        print("\n".join(lines))
 
     def print_skipped_jobs_summary(
         self, 
@@ -112,13 +115,14 @@ class SummaryReporter:
         if not skipped_due_to_deps:
             return
             
-        print("\nSkipped Jobs (unmet dependencies):")
+        lines = ["\nSkipped Jobs (unmet dependencies):"]
         for job_id, unmet, failed_unmet in skipped_due_to_deps:
             desc = jobs[job_id].get('description', '')
             if failed_unmet:
-                print(f"  - {job_id}: {desc}\n      Skipped (failed dependencies: {', '.join(failed_unmet)}; other unmet: {', '.join([d for d in unmet if d not in failed_unmet])})")
+                lines.append(f"  - {job_id}: {desc}\n      Skipped (failed dependencies: {', '.join(failed_unmet)}; other unmet: {', '.join([d for d in unmet if d not in failed_unmet])})")
             else:
-                print(f"  - {job_id}: {desc}\n      Skipped (unmet dependencies: {', '.join(unmet)})")
+                lines.append(f"  - {job_id}: {desc}\n      Skipped (unmet dependencies: {', '.join(unmet)})")
+        print("\n".join(lines))
 
     def print_resume_instructions(
         self, 
@@ -136,43 +140,54 @@ class SummaryReporter:
         if not (failed_job_order or has_skipped_deps):
             return
             
-        print(f"\n{Config.COLOR_CYAN}RESUME OPTIONS:{Config.COLOR_RESET}")
-        print(f"{Config.COLOR_CYAN}{'='*len('RESUME OPTIONS:')}{Config.COLOR_RESET}")
-        
-        # Always use the run_id for resume instructions
-        print(f"To continue this workflow:")
-        print(f"  {Config.COLOR_BLUE}executioner.py -c {self.config_file} --resume-from {run_id}{Config.COLOR_RESET}")
+        cyan, blue, reset = Config.COLOR_CYAN, Config.COLOR_BLUE, Config.COLOR_RESET
+        lines = [
+            f"\n{cyan}RESUME OPTIONS:{reset}",
+            f"{cyan}{'='*len('RESUME OPTIONS:')}{reset}",
+            # Always use the run_id for resume instructions
+            "To continue this workflow:",
+            f"  {blue}executioner.py -c {self.config_file} --resume-from {run_id}{reset}",
+        ]
         
         if failed_job_order:
-            print(f"\nTo retry only failed jobs:")
-            print(f"  {Config.COLOR_BLUE}executioner.py -c {self.config_file} --resume-from {run_id} --resume-failed-only{Config.COLOR_RESET}")
-            
-            # Suggest mark-success for manual fixes
-            print(f"\nIf you manually fixed and ran any failed jobs:")
-            print(f"  {Config.COLOR_BLUE}executioner.py --mark-success -r {run_id} -j <job_id>{Config.COLOR_RESET}")
-            print(f"  Example: executioner.py --mark-success -r {run_id} -j {failed_job_order[0]}")
+            lines.extend((
+                "\nTo retry only failed jobs:",
+                f"  {blue}executioner.py -c {self.config_file} --resume-from {run_id} --resume-failed-only{reset}",
+                # Suggest mark-success for manual fixes
+                "\nIf you manually fixed and ran any failed jobs:",
+                f"  {blue}executioner.py --mark-success -r {run_id} -j <job_id>{reset}",
+                f"  Example: executioner.py --mark-success -r {run_id} -j {failed_job_order[0]}",
+            ))
         
-        print(f"\nTo see detailed job status:")
-        print(f"  {Config.COLOR_BLUE}executioner.py --show-run {run_id}{Config.COLOR_RESET}")
+        lines.extend((
+            "\nTo see detailed job status:",
+            f"  {blue}executioner.py --show-run {run_id}{reset}",
+        ))
+        print("\n".join(lines))
 
     def _print_successful_run_info(self, run_id: int, attempt_id: int = None) -> None:
         """Print run information for successful executions."""
-        print(f"\n{Config.COLOR_CYAN}RUN INFORMATION:{Config.COLOR_RESET}")
-        print(f"{Config.COLOR_CYAN}{'='*len('RUN INFORMATION:')}{Config.COLOR_RESET}")
+        cyan, blue, reset = Config.COLOR_CYAN, Config.COLOR_BLUE, Config.COLOR_RESET
+        lines = [
+            f"\n{cyan}RUN INFORMATION:{reset}",
+            f"{cyan}{'='*len('RUN INFORMATION:')}{reset}",
+        ]
         
         # Show attempt info if this was a resume
         if attempt_id and attempt_id > 1:
-            print(f"{Config.COLOR_DARK_GREEN}✓ Run #{run_id} completed successfully after {attempt_id} attempts{Config.COLOR_RESET}")
+            lines.append(f"{Config.COLOR_DARK_GREEN}✓ Run #{run_id} completed successfully after {attempt_id} attempts{reset}")
         
-        print(f"To view detailed job status for this run:")
-        print(f"  {Config.COLOR_BLUE}executioner.py --show-run {run_id}{Config.COLOR_RESET}")
-        print(f"\nTo list all recent runs for {self.application_name}:")
-        print(f"  {Config.COLOR_BLUE}executioner.py --list-runs {self.application_name}{Config.COLOR_RESET}")
-        print(f"\nTo list all recent runs (all applications):")
-        print(f"  {Config.COLOR_BLUE}executioner.py --list-runs{Config.COLOR_RESET}")
+        lines.extend((
+            "To view detailed job status for this run:",
+            f"  {blue}executioner.py --show-run {run_id}{reset}",
+            f"\nTo list all recent runs for {self.application_name}:",
+            f"  {blue}executioner.py --list-runs {self.application_name}{reset}",
+            "\nTo list all recent runs (all applications):",
+            f"  {blue}executioner.py --list-runs{reset}",
+        ))
+        print("\n".join(lines))
 
     def print_final_divider(self) -> None:
         """Print the final summary divider."""
-        divider = f"{Config.COLOR_CYAN}{'='*40}{Config.COLOR_RESET}"
-        print(f"{divider}")
+        print(SUMMARY_DIVIDER)
         print("\n")
\ No newline at end of file
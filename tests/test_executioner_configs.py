@@ -1,7 +1,10 @@
 import os
+import json
+import sqlite3
 import subprocess
 import pytest
 import sys
+import time
 from pathlib import Path
 
 CONFIG_DIR = Path(__file__).parent.parent / "config"
@@ -39,4 +42,130 @@ def test_config_run(config_file, expected_exit, desc, tmp_path):
     cmd = [sys.executable, str(EXECUTIONER), "-c", str(config_path)]
     result = subprocess.run(cmd, capture_output=True, text=True)
     print(f"\n--- {desc} ---\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}")
-    assert result.returncode == expected_exit, f"{desc}: Expected exit {expected_exit}, got {result.returncode}\nSTDERR: {result.stderr}" 
\ No newline at end of file
+    assert result.returncode == expected_exit, f"{desc}: Expected exit {expected_exit}, got {result.returncode}\nSTDERR: {result.stderr}" 
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Runs executioner.py as __main__ with Config.DB_FILE pointed at a scratch database,
+# so these tests never touch data/jobs_history.db
+RUN_WITH_DB = (
+    "import runpy, sys; from pathlib import Path; from config.loader import Config; "
+    "Config.DB_FILE = Path(sys.argv[1]); sys.argv = sys.argv[2:]; "
+    "runpy.run_path(sys.argv[0], run_name='__main__')"
+)
+
+
+def run_config(config, tmp_path, name, *args):
+    """Write config to tmp_path/<name>/, run it against <name>.db there and return (result, db_path)."""
+    run_dir = tmp_path / name
+    run_dir.mkdir()
+    config = dict(config, application_name=name, working_dir=str(run_dir))
+    config_path = run_dir / f"{name}.json"
+    config_path.write_text(json.dumps(config))
+    db_path = run_dir / f"{name}.db"
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    cmd = [sys.executable, "-c", RUN_WITH_DB, str(db_path), str(EXECUTIONER), "-c", str(config_path), *args]
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    print(f"\n--- {name} ---\nSTDOUT:\n{result.stdout}\nSTDERR:\n{result.stderr}")
+    return result, db_path
+
+
+def job_history_rows(db_path):
+    """job_history rows keyed by job id, with the run-specific timing fields left out."""
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute(
+            "SELECT id, status, retry_count, retry_history, last_error FROM job_history"
+        ).fetchall()
+    result = {}
+    for job_id, status, retry_count, retry_history, last_error in rows:
+        attempts = [(a["attempt"], a["status"], a["exit_code"]) for a in json.loads(retry_history or "[]")]
+        result[job_id] = (status, retry_count, attempts, last_error)
+    return result
+
+
+RETRY_CONFIG = {
+    "parallel": True,
+    "max_workers": 2,
+    "email_on_failure": False,
+    "jobs": [
+        {"id": "flaky", "command": "test -f flaky.flag || { touch flaky.flag; exit 1; }",
+         "max_retries": 2, "retry_delay": 0.1, "retry_jitter": 0},
+        {"id": "broken", "command": "exit 2", "max_retries": 1, "retry_delay": 0.1,
+         "retry_jitter": 0, "retry_on_exit_codes": [2]},
+        {"id": "steady", "command": "echo ok", "dependencies": ["flaky"]},
+    ],
+}
+
+
+def test_batched_retry_history_matches_unbatched(tmp_path):
+    """batch_history_writes only changes when retry rows are written, not what ends up in job_history."""
+    results = {}
+    exit_codes = {}
+    for batched in (False, True):
+        name = "batched" if batched else "unbatched"
+        config = dict(RETRY_CONFIG, batch_history_writes=batched)
+        result, db_path = run_config(config, tmp_path, name, "--continue-on-error")
+        exit_codes[name] = result.returncode
+        results[name] = job_history_rows(db_path)
+    assert exit_codes["batched"] == exit_codes["unbatched"]
+    assert results["batched"] == results["unbatched"]
+    assert results["batched"]["flaky"][:3] == ("SUCCESS", 1, [(1, "FAILED", 1), (2, "SUCCESS", 0)])
+    assert results["batched"]["broken"][:3] == ("FAILED", 1, [(1, "FAILED", 2), (2, "FAILED", 2)])
+    assert results["batched"]["broken"][3]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_run_records_every_job(parallel, tmp_path):
+    """Each run thread reuses one connection for its writes; every job must still land in job_history."""
+    jobs = [{"id": "root", "command": "echo root"}]
+    jobs += [{"id": f"leaf{i}", "command": f"echo leaf{i}", "dependencies": ["root"]} for i in range(12)]
+    jobs.append({"id": "sink", "command": "echo sink", "dependencies": [f"leaf{i}" for i in range(12)]})
+    config = {"parallel": parallel, "max_workers": 4, "email_on_failure": False, "jobs": jobs}
+    result, db_path = run_config(config, tmp_path, "parallel" if parallel else "sequential")
+    assert result.returncode == 0, f"Expected exit 0, got {result.returncode}\nSTDERR: {result.stderr}"
+    rows = job_history_rows(db_path)
+    assert set(rows) == {job["id"] for job in jobs}
+    assert {status for status, _, _, _ in rows.values()} == {"SUCCESS"}
+
+
+def job_log_lines(db_path, name, job_id):
+    """Messages logged to a job's log file for run 1, without the timestamp/level prefix."""
+    log_path = db_path.parent / "logs" / f"executioner.{name}.job-{job_id}.run-1.log"
+    # Split on \n only, so a \r that leaked into a message stays visible
+    with open(log_path, newline="") as f:
+        return [line.rstrip("\n").split(" - ", 2)[-1] for line in f]
+
+
+def test_background_child_does_not_block_job(tmp_path):
+    """A child that inherits stdout and keeps writing must not hold the job open after it exits."""
+    config = {"email_on_failure": False, "jobs": [
+        {"id": "bg", "command": "(for i in $(seq 60); do echo tick; sleep 1; done) & echo started"},
+    ]}
+    start = time.monotonic()
+    result, db_path = run_config(config, tmp_path, "background")
+    elapsed = time.monotonic() - start
+    assert result.returncode == 0, f"Expected exit 0, got {result.returncode}\nSTDERR: {result.stderr}"
+    assert elapsed < 30, f"Run took {elapsed:.1f}s; output drain is not bounded"
+    assert "started" in job_log_lines(db_path, "background", "bg")
+
+
+def test_carriage_return_ends_output_lines(tmp_path):
+    r"""\r and \r\n end job output lines just like \n."""
+    config = {"email_on_failure": False, "jobs": [
+        {"id": "progress", "command": r"printf '10%%\r50%%\r100%%\r\ndone\nlast'"},
+    ]}
+    result, db_path = run_config(config, tmp_path, "progress")
+    assert result.returncode == 0, f"Expected exit 0, got {result.returncode}\nSTDERR: {result.stderr}"
+    lines = job_log_lines(db_path, "progress", "progress")
+    start = lines.index("10%")
+    assert lines[start:start + 5] == ["10%", "50%", "100%", "done", "last"]
+
+
+def test_dry_run_does_not_migrate_history(tmp_path):
+    """--dry-run must not run the job_history schema fix-ups that a real run applies."""
+    config = {"email_on_failure": False, "jobs": [{"id": "a", "command": "echo a"}]}
+    result, db_path = run_config(config, tmp_path, "dryrun", "--dry-run")
+    assert result.returncode == 0, f"Expected exit 0, got {result.returncode}\nSTDERR: {result.stderr}"
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(job_history)")}
+    assert "last_exit_code" not in columns